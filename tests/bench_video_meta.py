@@ -0,0 +1,105 @@
+"""Memory benchmark: yt-dlp info dicts vs. VideoMeta records.
+
+Builds synthetic info dicts shaped like yt-dlp's output for a YouTube video
+(60 formats with long signed URLs and HTTP headers, 40 thumbnails, a long
+description) and measures with tracemalloc how much memory stays allocated
+when N of them are kept, compared to keeping only their VideoMeta records.
+
+Usage:
+    python tests/bench_video_meta.py [N]    (default N=2000)
+"""
+
+import os
+import random
+import string
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from youtube_downloader import VideoMeta  # noqa: E402
+
+FORMATS = 60
+THUMBNAILS = 40
+CHAPTERS = 10
+
+
+def random_text(length):
+    """Return random ASCII letters and digits."""
+    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+
+
+def fake_info(index, headers):
+    """Return an info dict shaped like yt-dlp's output for one video."""
+    video_id = f'{index:011d}'
+    formats = [
+        {
+            'format_id': str(k), 'url': 'https://rr1---sn-' + random_text(1100),
+            'ext': 'mp4', 'width': 1920, 'height': 1080, 'fps': 30,
+            'vcodec': 'avc1.' + random_text(6), 'acodec': 'none', 'tbr': 1234.5,
+            'filesize': 10_000_000 + k, 'protocol': 'https', 'format_note': '1080p',
+            'http_headers': dict(headers),
+            'downloader_options': {'http_chunk_size': 10485760},
+            'format': f'{k} - 1920x1080 (1080p)', 'resolution': '1920x1080',
+            'dynamic_range': 'SDR', 'container': 'mp4_dash', 'quality': k,
+        }
+        for k in range(FORMATS)
+    ]
+    thumbnails = [
+        {
+            'url': f'https://i.ytimg.com/vi/{video_id}/{random_text(30)}.jpg',
+            'preference': -k, 'id': str(k), 'height': 90 * k, 'width': 160 * k,
+        }
+        for k in range(THUMBNAILS)
+    ]
+    return {
+        'id': video_id,
+        'title': 'Video ' + random_text(40),
+        'thumbnail': thumbnails[-1]['url'],
+        'duration': 3600,
+        'webpage_url': f'https://www.youtube.com/watch?v={video_id}',
+        'description': random_text(2000),
+        'formats': formats,
+        'thumbnails': thumbnails,
+        'tags': [random_text(10) for _ in range(20)],
+        'chapters': [
+            {'start_time': c * 60.0, 'end_time': c * 60.0 + 60, 'title': random_text(20)}
+            for c in range(CHAPTERS)
+        ],
+        'requested_formats': formats[:2],
+        'http_headers': dict(headers),
+    }
+
+
+def retained(count, keep_meta):
+    """Return the bytes still allocated after keeping `count` items."""
+    random.seed(0)
+    headers = {
+        'User-Agent': 'Mozilla/5.0 ' + random_text(90),
+        'Accept': 'text/html,' + random_text(60),
+        'Accept-Language': 'en-us,en;q=0.5',
+        'Sec-Fetch-Mode': 'navigate',
+    }
+
+    tracemalloc.start()
+    kept = []
+    for index in range(count):
+        info = fake_info(index, headers)
+        kept.append(VideoMeta.from_info(info) if keep_meta else info)
+        del info
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"{count} videos, {FORMATS} formats and {THUMBNAILS} thumbnails each")
+    for label, keep_meta in (('info dicts', False), ('VideoMeta', True)):
+        size = retained(count, keep_meta)
+        print(f"  {label:10}: {size / 2**20:7.1f} MiB retained "
+              f"({size / count / 1024:6.1f} KiB/item)")
+
+
+if __name__ == '__main__':
+    main()
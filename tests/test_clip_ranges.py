@@ -0,0 +1,128 @@
+"""Tests for clip timestamps, ranges, size estimates and clip progress."""
+
+import os
+import re
+import tempfile
+import time
+import unittest
+
+from youtube_downloader import (
+    ClipError, ClipRange, DownloadJob, VideoMeta, YouTubeDownloader,
+    clip_duration, parse_clip_range, parse_timestamp,
+)
+
+CHAPTERS = ((0, 60, 'Intro'), (60, 300, 'Part 1'), (300, 600, 'Part 2'))
+META = VideoMeta('abc', 'Video', duration=600, chapters=CHAPTERS, filesize=6000)
+
+
+def bare_app():
+    """Return an app instance without a Tk window."""
+    app = YouTubeDownloader.__new__(YouTubeDownloader)
+    app.log_message = lambda message: None
+    app.set_status = lambda message: None
+    return app
+
+
+class ParseTimestampTest(unittest.TestCase):
+
+    def test_formats(self):
+        self.assertEqual(parse_timestamp('90'), 90)
+        self.assertEqual(parse_timestamp('1:30'), 90)
+        self.assertEqual(parse_timestamp(' 01:02:03.5 '), 3723.5)
+        self.assertEqual(parse_timestamp('.5'), 0.5)
+        self.assertIsNone(parse_timestamp('  '))
+
+    def test_rejects_invalid(self):
+        for value in ('nan', 'inf', '1e3', '-5', '1:2:3:4', '1::2', 'abc',
+                      '1:70', '1:60', '1:05:60'):
+            with self.assertRaises(ValueError, msg=value):
+                parse_timestamp(value)
+
+
+class ParseClipRangeTest(unittest.TestCase):
+
+    def test_empty_means_whole_video(self):
+        self.assertIsNone(parse_clip_range('', '', ''))
+
+    def test_time_range(self):
+        self.assertEqual(parse_clip_range('1:00', '2:00', ''), ClipRange(60, 120, None))
+        self.assertEqual(parse_clip_range('', '30', ''), ClipRange(0, 30, None))
+        self.assertEqual(
+            parse_clip_range('30', '', ''), ClipRange(30, float('inf'), None)
+        )
+
+    def test_chapter(self):
+        self.assertEqual(
+            parse_clip_range('', '', ' Part '), ClipRange(0, float('inf'), 'Part')
+        )
+
+    def test_rejects_invalid(self):
+        for fields in (('2:00', '1:00', ''), ('1:00', '1:00', ''),
+                       ('1:00', '', 'Intro')):
+            with self.assertRaises(ValueError, msg=fields):
+                parse_clip_range(*fields)
+        with self.assertRaises(re.error):
+            parse_clip_range('', '', '(')
+
+
+class ClipDurationTest(unittest.TestCase):
+
+    def test_time_range(self):
+        self.assertEqual(clip_duration(ClipRange(60, 120, None), META), 60)
+        self.assertEqual(clip_duration(ClipRange(500, float('inf'), None), META), 100)
+        self.assertEqual(clip_duration(ClipRange(700, 800, None), META), 0)
+
+    def test_chapters(self):
+        self.assertEqual(clip_duration(ClipRange(0, float('inf'), 'Part'), META), 540)
+        self.assertEqual(clip_duration(ClipRange(0, float('inf'), 'Outro'), META), 0)
+
+    def test_unknown_duration(self):
+        self.assertIsNone(clip_duration(ClipRange(0, 10, None), VideoMeta()))
+
+
+class EstimateClipTest(unittest.TestCase):
+
+    def test_size_estimate(self):
+        job = DownloadJob('url', '/tmp', ClipRange(0, 60, None))
+        bare_app().estimate_clip(META, job)
+        self.assertAlmostEqual(job.clip_fraction, 0.1)
+        self.assertEqual(job.size_estimate, 'Estimated clip size: 600.0 B of 5.9 KB')
+
+    def test_empty_clip_is_a_clip_error(self):
+        for clip in (ClipRange(600, 700, None), ClipRange(0, float('inf'), 'Outro')):
+            with self.assertRaises(ClipError, msg=clip):
+                bare_app().estimate_clip(META, DownloadJob('url', '/tmp', clip))
+
+
+class WatchClipProgressTest(unittest.TestCase):
+
+    def test_progress_follows_growing_output(self):
+        app = bare_app()
+        reports = []
+        app.report_job_progress = lambda job, percentage: reports.append(percentage)
+
+        with tempfile.TemporaryDirectory() as directory:
+            base = os.path.join(directory, 'Video')
+            # Another job's file with a longer name must not be counted
+            with open(base + '_1.mp4', 'wb') as f:
+                f.write(b'x' * 1000)
+
+            stop = app.watch_clip_progress(DownloadJob('url', directory), base, 1000)
+            try:
+                with open(base + '.mp4.part', 'wb') as f:
+                    f.write(b'x' * 250)
+                    f.flush()
+                    time.sleep(1.2)
+                    f.write(b'x' * 1000)
+                    f.flush()
+                    time.sleep(1.2)
+            finally:
+                stop()
+
+        self.assertEqual(reports[0], 25)
+        self.assertEqual(reports[-1], 99.9)
+        self.assertEqual(reports, sorted(reports))
+
+
+if __name__ == '__main__':
+    unittest.main()
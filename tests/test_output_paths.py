@@ -0,0 +1,215 @@
+"""Tests for output path planning and no-overwrite publishing."""
+
+import errno
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from youtube_downloader import (
+    ClipRange, DeviceWriteScheduler, OutputPathPlanner, plan_jobs, publish_file,
+)
+
+
+class OutputPathPlannerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+        self.planner = OutputPathPlanner()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_added_files_are_never_handed_out(self):
+        self.planner.reserve(self.dir, 'warmup', '.txt')
+        # Written by yt-dlp's own template after the directory was listed
+        self.planner.add(os.path.join(self.dir, 'Song.MP4'))
+        self.assertEqual(
+            self.planner.reserve(self.dir, 'song', '.mp4'),
+            os.path.join(self.dir, 'song_1.mp4')
+        )
+
+    def test_forget_drops_owner_reservations(self):
+        first = self.planner.reserve(self.dir, 'video', '.mp4', owner='abc')
+        self.assertEqual(
+            self.planner.reserve(self.dir, 'video', '.mp4', owner='abc'), first
+        )
+        open(first, 'wb').close()
+        self.planner.forget(self.dir)
+        self.assertEqual(
+            self.planner.reserve(self.dir, 'video', '.mp4', owner='abc'),
+            os.path.join(self.dir, 'video_1.mp4')
+        )
+
+    def test_jobs_are_spread_round_robin(self):
+        clip = ClipRange(0, 10, None)
+        jobs = plan_jobs(['u1', 'u2', 'u3', 'u4', 'u5'], ['/a', '/b'], clip)
+        self.assertEqual([job.url for job in jobs], ['u1', 'u2', 'u3', 'u4', 'u5'])
+        self.assertEqual(
+            [job.directory for job in jobs], ['/a', '/b', '/a', '/b', '/a']
+        )
+        self.assertTrue(all(job.clip is clip for job in jobs))
+
+
+class PublishTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.tmp.name, 'staged.mp4')
+        self.target = os.path.join(self.tmp.name, 'video.mp4')
+        with open(self.source, 'wb') as f:
+            f.write(b'new')
+        with open(self.target, 'wb') as f:
+            f.write(b'existing')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def assert_untouched(self):
+        with open(self.target, 'rb') as f:
+            self.assertEqual(f.read(), b'existing')
+        self.assertTrue(os.path.exists(self.source))
+
+    def test_never_overwrites(self):
+        with self.assertRaises(FileExistsError):
+            publish_file(self.source, self.target)
+        self.assert_untouched()
+
+    def test_never_overwrites_without_hard_links(self):
+        with mock.patch('os.link', side_effect=PermissionError):
+            with self.assertRaises(FileExistsError):
+                publish_file(self.source, self.target)
+            self.assert_untouched()
+
+            free = os.path.join(self.tmp.name, 'free.mp4')
+            publish_file(self.source, free)
+        with open(free, 'rb') as f:
+            self.assertEqual(f.read(), b'new')
+        self.assertFalse(os.path.exists(self.source))
+
+    def test_failed_rename_leaves_no_placeholder(self):
+        exdev = OSError(errno.EXDEV, 'Invalid cross-device link')
+        free = os.path.join(self.tmp.name, 'free.mp4')
+        with mock.patch('os.link', side_effect=PermissionError), \
+                mock.patch('os.replace', side_effect=exdev):
+            with self.assertRaises(OSError):
+                publish_file(self.source, free)
+        self.assertFalse(os.path.exists(free))
+        self.assertTrue(os.path.exists(self.source))
+
+    def test_commit_copies_across_bind_mounts(self):
+        scheduler = DeviceWriteScheduler(os.path.join(self.tmp.name, 'staging'))
+        free = os.path.join(self.tmp.name, 'free.mp4')
+        link = os.link
+
+        def bind_mount_link(source, target):
+            # Same st_dev, but the staged file is on another mount
+            if source == self.source:
+                raise OSError(errno.EXDEV, 'Invalid cross-device link')
+            link(source, target)
+
+        with mock.patch('os.link', side_effect=bind_mount_link):
+            scheduler.commit(self.source, free)
+        with open(free, 'rb') as f:
+            self.assertEqual(f.read(), b'new')
+        self.assertFalse(os.path.exists(self.source))
+
+    def test_commit_ignores_stale_partial(self):
+        scheduler = DeviceWriteScheduler(os.path.join(self.tmp.name, 'staging'))
+        # Force the cross-device copy path
+        scheduler.device_of = lambda path: 1 if path == self.source else 2
+        free = os.path.join(self.tmp.name, 'free.mp4')
+        with open(free + '.part', 'wb') as f:
+            f.write(b'left by a crash')
+
+        scheduler.commit(self.source, free)
+        with open(free, 'rb') as f:
+            self.assertEqual(f.read(), b'new')
+        self.assertEqual(
+            sorted(os.listdir(self.tmp.name)),
+            ['free.mp4', 'free.mp4.part', 'staging', 'video.mp4']
+        )
+
+    def test_commit_keeps_staged_file_on_clash(self):
+        scheduler = DeviceWriteScheduler(os.path.join(self.tmp.name, 'staging'))
+        with self.assertRaises(FileExistsError):
+            scheduler.commit(self.source, self.target)
+        self.assert_untouched()
+
+
+class DeviceWriteSchedulerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.staging = os.path.join(self.tmp.name, 'staging')
+        self.root = os.path.join(self.tmp.name, 'root')
+        os.mkdir(self.root)
+        self.scheduler = DeviceWriteScheduler(self.staging, buffer_size=1024)
+        # Pretend the root is on another device so commits copy
+        self.scheduler.device_of = lambda path: 2 if path == self.root else 1
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def stage(self, name, size):
+        path = self.scheduler.staging_path(os.path.join(self.root, name))
+        with open(path, 'wb') as f:
+            f.write(b'x' * size)
+        return path
+
+    def test_one_writer_per_device(self):
+        lock = threading.Lock()
+        active = []
+        peak = []
+        fsync = os.fsync
+
+        def slow_fsync(fd):
+            with lock:
+                active.append(fd)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(fd)
+            fsync(fd)
+
+        sources = [self.stage(f'v{n}.mp4', 4096) for n in range(4)]
+        with mock.patch('os.fsync', side_effect=slow_fsync):
+            threads = [
+                threading.Thread(
+                    target=self.scheduler.commit,
+                    args=(source, os.path.join(self.root, os.path.basename(source)))
+                )
+                for source in sources
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(max(peak), 1)
+        self.assertEqual(sorted(os.listdir(self.root)), ['v0.mp4', 'v1.mp4', 'v2.mp4', 'v3.mp4'])
+
+    def test_commit_records_throughput(self):
+        source = self.stage('v.mp4', 3000)
+        self.scheduler.commit(source, os.path.join(self.root, 'v.mp4'))
+        label, written, elapsed = self.scheduler.stats[2]
+        self.assertEqual((label, written), (self.root, 3000))
+        self.assertGreater(elapsed, 0)
+
+    def test_report_and_reset(self):
+        self.scheduler.record(2, '/mnt/disk', 10 * 1024 * 1024, 1.0)
+        self.scheduler.record(2, '/mnt/disk', 10 * 1024 * 1024, 3.0)
+        self.scheduler.record(3, '/mnt/nas', 512, 0.0)
+        self.assertEqual(self.scheduler.report(), [
+            '/mnt/disk: 20.0 MB at 5.0 MB/s',
+            '/mnt/nas: 512.0 B at 0.0 B/s',
+        ])
+        self.scheduler.reset_stats()
+        self.assertEqual(self.scheduler.report(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
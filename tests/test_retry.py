@@ -0,0 +1,338 @@
+"""Tests for the retry policy, circuit breaker and download retry loop
+against a local fault-injecting HTTP server."""
+
+import functools
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import yt_dlp
+
+from youtube_downloader import (
+    INNER_RETRIES, CircuitBreaker, DeviceWriteScheduler, DownloadJob,
+    OutputPathPlanner, RetryPolicy, YouTubeDownloader, breaker_key,
+    error_host, error_status,
+)
+
+PAYLOAD = bytes(range(256)) * 800  # 200 KiB of media
+TRUNCATED_CHUNK = 20000  # Bytes sent before a 'truncated' fault drops the connection
+
+
+class FaultHandler(BaseHTTPRequestHandler):
+    """Serves a fault chosen by the request path."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.startswith('/429'):
+            self.send_response(429)
+            self.send_header('Retry-After', '7')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        elif self.path.startswith(('/503', '/404')):
+            self.send_response(int(self.path[1:4]))
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        elif self.path.startswith('/page/'):
+            # A page whose <video>s point at /media/, so faults scripted for
+            # the media never hit extraction; "/page/a,b" is a playlist
+            name = self.path[len('/page/'):]
+            videos = ''.join(
+                f'<video src="/media/{media}.mp4"></video>' for media in name.split(',')
+            )
+            body = (
+                f'<html><head><title>{name}</title></head><body>{videos}</body></html>'
+            ).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif self.path.startswith('/media/'):
+            self.serve_media(self.path[len('/media/'):-len('.mp4')])
+        elif self.path.startswith('/truncated'):
+            # Promise more bytes than are sent, then drop the connection
+            self.send_response(200)
+            self.send_header('Content-Type', 'video/mp4')
+            self.send_header('Content-Length', '100000')
+            self.end_headers()
+            self.wfile.write(b'x' * 50000)
+            self.close_connection = True
+        else:
+            self.send_response(404)
+            self.end_headers()
+
+    def serve_media(self, name):
+        """Serve PAYLOAD with Range support, failing as the name's script says."""
+        match = re.match(r'bytes=(\d+)-', self.headers.get('Range') or '')
+        start = int(match.group(1)) if match else 0
+        self.server.requests.append((name, start))
+        script = self.server.scripts.get(name) or []
+        fault = script.pop(0) if script else None
+
+        if fault == '503':
+            self.send_response(503)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        body = PAYLOAD[start:]
+        self.send_response(206 if start else 200)
+        self.send_header('Content-Type', 'video/mp4')
+        self.send_header('Content-Length', str(len(body)))
+        if start:
+            self.send_header(
+                'Content-Range', f'bytes {start}-{len(PAYLOAD) - 1}/{len(PAYLOAD)}'
+            )
+        self.end_headers()
+        if fault == 'truncated':
+            self.wfile.write(body[:TRUNCATED_CHUNK])
+            self.close_connection = True
+        else:
+            self.wfile.write(body)
+
+
+class FaultServerTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), FaultHandler)
+        cls.server.scripts = {}   # media name -> faults for its next requests
+        cls.server.requests = []  # (media name, range start) per request
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def fetch_error(self, path):
+        """Return the error urllib raises for a path."""
+        with self.assertRaises(HTTPError) as ctx:
+            urlopen(self.base + path, timeout=5).read()
+        ctx.exception.close()
+        return ctx.exception
+
+    def ydl_error(self, path, download=False):
+        """Return the DownloadError yt-dlp raises for a path."""
+        opts = {
+            'quiet': True, 'no_warnings': True, 'noprogress': True,
+            'retries': 0, 'paths': {'home': tempfile.mkdtemp()},
+        }
+        with self.assertRaises(yt_dlp.utils.DownloadError) as ctx:
+            with yt_dlp.YoutubeDL(opts) as ydl:
+                ydl.extract_info(self.base + path, download=download)
+        return ctx.exception
+
+
+class RetryPolicyTest(FaultServerTestCase):
+
+    def setUp(self):
+        self.policy = RetryPolicy(max_attempts=5, base_delay=2.0, max_delay=30.0)
+
+    def test_throttling_is_retryable_and_honors_retry_after(self):
+        error = self.fetch_error('/429')
+        self.assertEqual(error_status(error), 429)
+        self.assertTrue(self.policy.is_retryable(error))
+        self.assertEqual(self.policy.delay(1, error), 7.0)
+
+    def test_server_errors_are_retryable(self):
+        self.assertTrue(self.policy.is_retryable(self.fetch_error('/503')))
+        self.assertTrue(self.policy.is_retryable(self.ydl_error('/503')))
+
+    def test_not_found_is_fatal(self):
+        self.assertFalse(self.policy.is_retryable(self.fetch_error('/404')))
+        self.assertFalse(self.policy.is_retryable(self.ydl_error('/404')))
+
+    def test_truncated_body_is_retryable(self):
+        error = self.ydl_error('/truncated.mp4', download=True)
+        self.assertTrue(self.policy.is_retryable(error))
+
+    def test_yt_dlp_errors_keep_status_and_host(self):
+        error = self.ydl_error('/429')
+        self.assertEqual(error_status(error), 429)
+        self.assertTrue(self.policy.is_retryable(error))
+        self.assertEqual(error_host(error, 'www.youtube.com'), '127.0.0.1')
+
+    def test_fatal_messages(self):
+        for message in ('ERROR: [youtube] abc: Private video',
+                        'ERROR: Video unavailable',
+                        'ERROR: ffprobe and ffmpeg not found'):
+            self.assertFalse(
+                self.policy.is_retryable(yt_dlp.utils.DownloadError(message))
+            )
+        self.assertFalse(self.policy.is_retryable(PermissionError('denied')))
+        self.assertTrue(self.policy.is_retryable(ConnectionResetError('reset')))
+
+    def test_backoff_bounds(self):
+        for attempt in range(1, 8):
+            ceiling = min(30.0, 2.0 * 2 ** (attempt - 1))
+            delays = [self.policy.delay(attempt) for _ in range(200)]
+            self.assertTrue(all(0 <= d <= ceiling for d in delays))
+            # Full jitter spreads delays over the whole window
+            self.assertGreater(max(delays), ceiling / 2)
+
+
+class ImmediateRoot:
+    """Stands in for the Tk root, running scheduled callbacks at once."""
+
+    def after(self, delay, callback, *args):
+        callback(*args)
+
+
+class DownloadWithRetryTest(FaultServerTestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.home = os.path.join(self.tmp, 'root')
+        os.mkdir(self.home)
+
+        app = YouTubeDownloader.__new__(YouTubeDownloader)
+        app.root = ImmediateRoot()
+        app.retry_policy = RetryPolicy(max_attempts=2, base_delay=0.01)
+        app.breakers = {}
+        app.breakers_lock = threading.Lock()
+        app.path_planner = OutputPathPlanner()
+        app.write_scheduler = DeviceWriteScheduler(os.path.join(self.tmp, 'staging'))
+        app.log_message = lambda message: None
+        app.report_job_progress = lambda job, percentage: None
+        self.statuses = []
+        app.set_status = self.statuses.append
+        self.app = app
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def download(self, name, script):
+        """Run download_with_retry for a media name with scripted faults."""
+        self.server.scripts[name] = list(script)
+        job = DownloadJob(f"{self.base}/page/{name}", self.home)
+        ydl_opts = {
+            'quiet': True, 'no_warnings': True, 'noprogress': True,
+            'format': 'best',
+            'paths': {'home': self.home},
+            'outtmpl': '%(title)s.%(ext)s',
+            'progress_hooks': [functools.partial(self.app.progress_hook, job)],
+        }
+        return self.app.download_with_retry(job, ydl_opts, '.mp4')
+
+    def starts(self, name):
+        return [start for media, start in self.server.requests if media == name]
+
+    def test_resumes_and_completes(self):
+        # Attempt 1 exhausts yt-dlp's own retries on 503s. Attempt 2 keeps
+        # getting truncated but resumes further each time, which restarts
+        # the attempt count instead of giving up at max_attempts=2.
+        script = ['503'] * (INNER_RETRIES + 1) + ['truncated'] * (INNER_RETRIES + 1)
+        meta, filename = self.download('resume', script)
+
+        self.assertEqual(os.path.dirname(filename), self.home)
+        with open(filename, 'rb') as f:
+            self.assertEqual(f.read(), PAYLOAD)
+
+        starts = self.starts('resume')
+        self.assertEqual(starts[:INNER_RETRIES + 1], [0] * (INNER_RETRIES + 1))
+        resumed = [start for start in starts if start]
+        self.assertGreaterEqual(len(resumed), INNER_RETRIES + 1)
+        self.assertEqual(resumed, sorted(resumed))
+        self.assertTrue(any('HTTP 503 from 127.0.0.1; retry 2 of 2' in status
+                            for status in self.statuses))
+        self.assertEqual(os.listdir(self.home), [os.path.basename(filename)])
+
+    def test_retried_playlist_keeps_published_entries(self):
+        self.server.scripts['second'] = ['503'] * (INNER_RETRIES + 1)
+        self.download('first,second', [])
+
+        self.assertEqual(len(self.starts('first')), 1)
+        names = sorted(os.listdir(self.home))
+        self.assertEqual(len(names), 2)
+        for name in names:
+            with open(os.path.join(self.home, name), 'rb') as f:
+                self.assertEqual(f.read(), PAYLOAD)
+        staged = [name for _, _, names in os.walk(self.app.write_scheduler.staging_dir)
+                  for name in names]
+        self.assertEqual(staged, [])
+
+    def test_gives_up_after_max_attempts(self):
+        with self.assertRaises(yt_dlp.utils.DownloadError):
+            self.download('down', ['503'] * 100)
+        self.assertEqual(len(self.starts('down')), 2 * (INNER_RETRIES + 1))
+        self.assertEqual(os.listdir(self.home), [])
+
+    def test_breakers_are_shared_per_domain(self):
+        self.assertEqual(
+            breaker_key('rr5---sn-abc.googlevideo.com'),
+            breaker_key('rr1---sn-xyz.googlevideo.com'),
+        )
+        self.assertEqual(breaker_key('www.YouTube.com'), 'youtube.com')
+        self.assertEqual(breaker_key('127.0.0.1'), '127.0.0.1')
+        self.assertIs(
+            self.app.get_breaker('rr5---sn-abc.googlevideo.com'),
+            self.app.get_breaker('rr1---sn-xyz.googlevideo.com'),
+        )
+
+
+class CircuitBreakerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.breaker = CircuitBreaker(max_concurrency=4, failure_threshold=3, cooldown=0.1)
+
+    def fail(self, times, retryable=True):
+        for _ in range(times):
+            self.breaker.acquire()
+            self.breaker.release(False, retryable)
+
+    def test_trips_after_threshold_and_halves_limit(self):
+        self.fail(2)
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.fail(1)
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(self.breaker.limit, 2)
+
+    def test_fatal_errors_do_not_trip(self):
+        self.fail(10, retryable=False)
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(self.breaker.limit, 4)
+
+    def test_waits_out_cooldown_then_half_opens(self):
+        self.fail(3)
+        started = time.monotonic()
+        allowed = self.breaker.acquire()
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertEqual(allowed, 1)
+
+        self.breaker.release(True)
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(self.breaker.limit, 3)
+
+    def test_failed_probe_reopens(self):
+        self.fail(3)
+        self.breaker.acquire()
+        self.breaker.release(False, True)
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(self.breaker.limit, 1)
+
+    def test_half_open_admits_a_single_probe(self):
+        self.fail(3)
+        self.breaker.acquire()
+        second = threading.Thread(target=self.breaker.acquire, daemon=True)
+        second.start()
+        second.join(0.3)
+        self.assertTrue(second.is_alive())
+        self.breaker.release(True)
+        second.join(1)
+        self.assertFalse(second.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Tests for the offline YouTube URL parser and bulk import."""
+
+import unittest
+
+from youtube_downloader import extract_youtube_urls, parse_youtube_url
+
+VIDEO = 'https://www.youtube.com/watch?v=dQw4w9WgXcQ'
+OTHER = 'https://www.youtube.com/watch?v=9bZkp7q19f0'
+
+
+class ParseYouTubeURLTest(unittest.TestCase):
+
+    def test_variants_share_canonical_url(self):
+        for url in (
+            'youtu.be/dQw4w9WgXcQ',
+            'https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=30',
+            'https://youtube.com/shorts/dQw4w9WgXcQ',
+            'https://m.youtube.com/embed/dQw4w9WgXcQ',
+        ):
+            self.assertEqual(parse_youtube_url(url).canonical, VIDEO)
+
+    def test_playlist_and_channel(self):
+        playlist = parse_youtube_url(
+            'https://www.youtube.com/playlist?list=PLx0sYbCqOb8TBPRdmBHs5Iftvv9TPboYG'
+        )
+        self.assertEqual(playlist.playlist_id, 'PLx0sYbCqOb8TBPRdmBHs5Iftvv9TPboYG')
+        self.assertEqual(
+            parse_youtube_url('https://www.youtube.com/@SomeHandle/videos').canonical,
+            'https://www.youtube.com/@SomeHandle'
+        )
+
+    def test_rejects_non_youtube(self):
+        for url in ('', 'https://example.com/watch?v=dQw4w9WgXcQ',
+                    'https://notyoutube.com/watch?v=dQw4w9WgXcQ',
+                    'https://www.youtube.com/watch?v=short'):
+            self.assertIsNone(parse_youtube_url(url))
+
+
+class ExtractYouTubeURLsTest(unittest.TestCase):
+
+    def test_csv_rows(self):
+        text = (
+            "url,title\n"
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ,Rick\n"
+            "https://youtu.be/9bZkp7q19f0;Gangnam\n"
+            "https://youtu.be/dQw4w9WgXcQ,Rick again\n"
+        )
+        self.assertEqual(extract_youtube_urls(text), [VIDEO, OTHER])
+
+    def test_sentence_punctuation(self):
+        text = (
+            "Watched https://www.youtube.com/watch?v=dQw4w9WgXcQ, then "
+            "https://youtu.be/9bZkp7q19f0; great. Also youtu.be/dQw4w9WgXcQ!"
+        )
+        self.assertEqual(extract_youtube_urls(text), [VIDEO, OTHER])
+
+    def test_html_export(self):
+        text = (
+            '<a href="https://www.youtube.com/watch?v=dQw4w9WgXcQ&amp;t=30">x</a>'
+            '<a href="//www.youtube.com/watch?v=9bZkp7q19f0&amp;list=PLx0sYbCqOb8TBPRdmBHs5Iftvv9TPboYG">y</a>'
+        )
+        self.assertEqual(extract_youtube_urls(text), [VIDEO, OTHER])
+
+    def test_ignores_look_alike_hosts(self):
+        text = "notyoutube.com/watch?v=dQw4w9WgXcQ https://fakeyoutu.be/dQw4w9WgXcQ"
+        self.assertEqual(extract_youtube_urls(text), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Tests for the compact VideoMeta record."""
+
+import unittest
+
+from youtube_downloader import VideoMeta
+
+INFO = {
+    'id': 'dQw4w9WgXcQ',
+    'title': 'Video',
+    'thumbnail': 'https://i.ytimg.com/vi/dQw4w9WgXcQ/maxresdefault.jpg',
+    'duration': 212,
+    'webpage_url': 'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+    'formats': [{'format_id': str(n), 'url': 'https://example.com'} for n in range(50)],
+    'description': 'x' * 5000,
+}
+
+
+class VideoMetaTest(unittest.TestCase):
+
+    def test_fields(self):
+        meta = VideoMeta.from_info(INFO)
+        self.assertEqual(meta.video_id, 'dQw4w9WgXcQ')
+        self.assertEqual(meta.title, 'Video')
+        self.assertEqual(meta.thumbnail, INFO['thumbnail'])
+        self.assertEqual(meta.duration, 212)
+        self.assertEqual(meta.webpage_url, INFO['webpage_url'])
+        self.assertEqual(meta.chapters, ())
+        self.assertIsNone(meta.filesize)
+
+    def test_filesize_sums_requested_formats(self):
+        info = dict(INFO, requested_formats=[
+            {'format_id': '137', 'filesize': 1000},
+            {'format_id': '140', 'filesize': 200},
+        ])
+        self.assertEqual(VideoMeta.from_info(info).filesize, 1200)
+
+    def test_filesize_falls_back_to_approx(self):
+        info = dict(INFO, requested_formats=[
+            {'format_id': '137', 'filesize': None, 'filesize_approx': 1000},
+            {'format_id': '140', 'filesize': 200},
+        ])
+        self.assertEqual(VideoMeta.from_info(info).filesize, 1200)
+        # A single combined format is described by the info dict itself
+        self.assertEqual(
+            VideoMeta.from_info(dict(INFO, filesize_approx=500)).filesize, 500
+        )
+
+    def test_chapters(self):
+        info = dict(INFO, chapters=[
+            {'start_time': 0.0, 'end_time': 60.0, 'title': 'Intro'},
+            {'start_time': 60.0, 'end_time': 212.0},
+        ])
+        self.assertEqual(
+            VideoMeta.from_info(info).chapters,
+            ((0.0, 60.0, 'Intro'), (60.0, 212.0, '')),
+        )
+
+    def test_missing_fields(self):
+        meta = VideoMeta.from_info({'chapters': None})
+        self.assertEqual(meta.title, 'Unknown')
+        self.assertIsNone(meta.video_id)
+        self.assertEqual(meta.chapters, ())
+
+    def test_keeps_no_info_dict(self):
+        meta = VideoMeta.from_info(INFO)
+        self.assertFalse(hasattr(meta, '__dict__'))
+        with self.assertRaises(AttributeError):
+            meta.formats = INFO['formats']
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,7 +7,11 @@ Features:
 - Download videos in MP4 or MP3 format
 - Real-time progress tracking
 - Thumbnail preview
+- Bulk URL import with de-duplication
+- Time-range and chapter clip downloads
 - Threading to keep GUI responsive
+- Automatic retries with backoff and per-host circuit breaking
+- Multiple output roots with per-device batched disk writes
 - Comprehensive error handling
 """
 
@@ -15,13 +19,27 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import tkinter.font as tkfont
 import threading
+import time
+import random
+import socket
+import queue
+import concurrent.futures
+import hashlib
+import functools
+import contextlib
+import errno
+import tempfile
 import os
 import sys
 import shutil
 import re
+import math
+import html
+from collections import namedtuple
 from pathlib import Path
 from urllib.request import urlretrieve
 from urllib.error import URLError
+from urllib.parse import urlsplit, parse_qs
 from datetime import datetime
 import json
 
@@ -40,6 +58,1036 @@ except ImportError:
     sys.exit(1)
 
 
+# ==================== URL PARSING ====================
+# Parsed YouTube link. Any field may be None; canonical is the normalized URL
+# used for de-duplication and as the key handed to yt-dlp.
+YouTubeURL = namedtuple(
+    'YouTubeURL', ['video_id', 'playlist_id', 'channel_id', 'canonical']
+)
+
+YOUTUBE_HOSTS = {
+    'youtube.com', 'www.youtube.com', 'm.youtube.com', 'music.youtube.com',
+    'youtube-nocookie.com', 'www.youtube-nocookie.com',
+}
+SHORT_HOSTS = {'youtu.be', 'www.youtu.be'}
+
+VIDEO_ID_RE = re.compile(r'^[A-Za-z0-9_-]{11}$')
+PLAYLIST_ID_RE = re.compile(r'^[A-Za-z0-9_-]{10,64}$')
+CHANNEL_ID_RE = re.compile(r'^UC[A-Za-z0-9_-]{22}$')
+HANDLE_RE = re.compile(r'^@[A-Za-z0-9_.-]{3,30}$')
+
+# Path prefixes that carry the video ID as the next path segment
+VIDEO_PATH_PREFIXES = {'shorts', 'embed', 'v', 'e', 'live'}
+
+# Finds YouTube links inside arbitrary text, HTML exports and CSV rows
+# included. The lookbehind keeps look-alike hosts such as notyoutube.com out.
+URL_IN_TEXT_RE = re.compile(
+    r'(?<![A-Za-z0-9.-])(?:https?://)?(?:[A-Za-z0-9-]+\.)?'
+    r'(?:youtube(?:-nocookie)?\.com|youtu\.be)/[^\s"\'<>()\[\],;]+',
+    re.IGNORECASE
+)
+
+# Sentence punctuation that commonly trails a pasted link
+TRAILING_PUNCTUATION = '.,;:!?'
+
+
+def parse_youtube_url(url):
+    """Parse a YouTube link offline into canonical video/playlist/channel IDs.
+
+    Handles watch, youtu.be, shorts, embed, live, playlist and channel URLs.
+    `youtu.be/X`, `watch?v=X&t=30` and `shorts/X` all yield the same
+    canonical URL.
+
+    Args:
+        url: The URL to parse
+
+    Returns:
+        YouTubeURL: Parsed IDs, or None if the URL is not a YouTube link
+    """
+    if not url:
+        return None
+
+    url = url.strip()
+    if '://' not in url:
+        url = 'https://' + url
+
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return None
+
+    host = (parts.hostname or '').lower()
+    segments = [s for s in parts.path.split('/') if s]
+    query = parse_qs(parts.query)
+
+    video_id = None
+    channel_id = None
+
+    if host in SHORT_HOSTS:
+        if segments:
+            video_id = segments[0]
+    elif host in YOUTUBE_HOSTS:
+        if segments and segments[0] == 'watch':
+            video_id = query.get('v', [None])[0]
+        elif len(segments) >= 2 and segments[0] in VIDEO_PATH_PREFIXES:
+            video_id = segments[1]
+        elif len(segments) >= 2 and segments[0] in ('channel', 'c', 'user'):
+            if segments[0] == 'channel':
+                channel_id = segments[1]
+                if not CHANNEL_ID_RE.match(channel_id):
+                    return None
+            else:
+                channel_id = f"{segments[0]}/{segments[1]}"
+        elif segments and segments[0].startswith('@'):
+            channel_id = segments[0]
+            if not HANDLE_RE.match(channel_id):
+                return None
+    else:
+        return None
+
+    playlist_id = query.get('list', [None])[0]
+    if playlist_id and not PLAYLIST_ID_RE.match(playlist_id):
+        playlist_id = None
+
+    if video_id is not None and not VIDEO_ID_RE.match(video_id):
+        return None
+
+    if video_id:
+        canonical = f"https://www.youtube.com/watch?v={video_id}"
+    elif playlist_id:
+        canonical = f"https://www.youtube.com/playlist?list={playlist_id}"
+    elif channel_id:
+        if channel_id.startswith('UC'):
+            canonical = f"https://www.youtube.com/channel/{channel_id}"
+        else:
+            canonical = f"https://www.youtube.com/{channel_id}"
+    else:
+        return None
+
+    return YouTubeURL(video_id, playlist_id, channel_id, canonical)
+
+
+def extract_youtube_urls(text):
+    """Extract, normalize and de-duplicate YouTube links from text.
+
+    Works on plain text (one URL per line or free-form), clipboard contents
+    and HTML exports such as bookmarks or watch history. Order of first
+    appearance is preserved.
+
+    Args:
+        text: Raw text or HTML to scan
+
+    Returns:
+        list: Unique canonical URLs
+    """
+    if not text:
+        return []
+
+    # HTML exports escape '&' in hrefs as '&amp;'
+    if '&' in text:
+        text = html.unescape(text)
+
+    seen = set()
+    urls = []
+    for match in URL_IN_TEXT_RE.finditer(text):
+        parsed = parse_youtube_url(match.group(0).rstrip(TRAILING_PUNCTUATION))
+        if parsed and parsed.canonical not in seen:
+            seen.add(parsed.canonical)
+            urls.append(parsed.canonical)
+    return urls
+
+
+# ==================== VIDEO METADATA ====================
+class VideoMeta:
+    """Compact record of the few video fields the app actually uses.
+
+    yt-dlp info dicts carry every format, thumbnail and HTTP header and can
+    reach hundreds of KB per video. Only this record is kept around in the
+    GUI, caches and queue; the info dict is dropped as soon as it is read.
+    """
+
+    __slots__ = (
+        'video_id', 'title', 'thumbnail', 'duration', 'webpage_url',
+        'chapters', 'filesize',
+    )
+
+    def __init__(self, video_id=None, title=None, thumbnail=None, duration=None,
+                 webpage_url=None, chapters=(), filesize=None):
+        """Initialize the record.
+
+        Args:
+            video_id: YouTube video ID
+            title: Video title
+            thumbnail: Thumbnail URL
+            duration: Length in seconds
+            webpage_url: Canonical page URL
+            chapters: Tuple of (start_time, end_time, title) tuples
+            filesize: Combined size in bytes of the selected formats
+        """
+        self.video_id = video_id
+        self.title = title
+        self.thumbnail = thumbnail
+        self.duration = duration
+        self.webpage_url = webpage_url
+        self.chapters = chapters
+        self.filesize = filesize
+
+    @classmethod
+    def from_info(cls, info):
+        """Build a record from a yt-dlp info dict.
+
+        Args:
+            info: yt-dlp info dict
+
+        Returns:
+            VideoMeta: The extracted fields
+        """
+        chapters = tuple(
+            (ch.get('start_time', 0), ch.get('end_time', 0), ch.get('title', ''))
+            for ch in info.get('chapters') or []
+        )
+
+        formats = info.get('requested_formats') or [info]
+        filesize = sum(
+            f.get('filesize') or f.get('filesize_approx') or 0 for f in formats
+        )
+
+        return cls(
+            video_id=info.get('id'),
+            title=info.get('title', 'Unknown'),
+            thumbnail=info.get('thumbnail'),
+            duration=info.get('duration'),
+            webpage_url=info.get('webpage_url'),
+            chapters=chapters,
+            filesize=filesize or None,
+        )
+
+    def __repr__(self):
+        return f"VideoMeta({self.video_id!r}, {self.title!r})"
+
+
+# ==================== DOWNLOAD JOBS ====================
+class DownloadJob:
+    """State of one queued download.
+
+    The job is bound into its yt-dlp progress hook, so progress is tracked
+    per job no matter which thread yt-dlp reports from (fragment downloads
+    use their own thread pool).
+    """
+
+    __slots__ = (
+        'url', 'directory', 'clip', 'clip_fraction', 'size_estimate', 'progress',
+        'file_bytes',
+    )
+
+    def __init__(self, url, directory, clip=None):
+        """Initialize the job.
+
+        Args:
+            url: Canonical URL to download
+            directory: Output root to save to
+            clip: Optional ClipRange to download
+        """
+        self.url = url
+        self.directory = directory
+        self.clip = clip
+        self.clip_fraction = None  # Share of each format covered by the clip
+        self.size_estimate = None  # Human readable clip size estimate
+        self.progress = 0.0
+        self.file_bytes = {}  # Output file -> most bytes seen on disk
+
+    def record_bytes(self, name, count):
+        """Note how many bytes of one output file have been downloaded.
+
+        Args:
+            name: Output file the bytes belong to
+            count: Bytes downloaded so far, including resumed ones
+        """
+        self.file_bytes[name] = max(self.file_bytes.get(name, 0), count)
+
+    @property
+    def downloaded_bytes(self):
+        """int: Most bytes downloaded so far, summed over files and attempts."""
+        return sum(self.file_bytes.values())
+
+
+def plan_jobs(urls, directories, clip=None):
+    """Create the jobs of a run, spreading them round-robin over the roots.
+
+    Args:
+        urls: Canonical URLs to download
+        directories: Output roots
+        clip: Optional ClipRange applied to every video
+
+    Returns:
+        list: One DownloadJob per URL
+    """
+    return [
+        DownloadJob(url, directories[index % len(directories)], clip)
+        for index, url in enumerate(urls)
+    ]
+
+
+# ==================== CLIP RANGES ====================
+# Part of a video to download. start/end are seconds (end may be inf);
+# chapter is a regex matched against chapter titles, or None.
+ClipRange = namedtuple('ClipRange', ['start', 'end', 'chapter'])
+
+# One component of a timestamp: plain digits with an optional fraction
+TIMESTAMP_PART_RE = re.compile(r'^(?:\d+(?:\.\d*)?|\.\d+)$')
+CLIP_PROGRESS_INTERVAL = 0.5  # Seconds between clip output size polls
+
+
+class ClipError(Exception):
+    """Raised when a clip covers nothing of the video being downloaded."""
+
+
+def parse_timestamp(value):
+    """Parse a timestamp such as "90", "1:30" or "01:02:03.5" into seconds.
+
+    Args:
+        value: The timestamp string
+
+    Returns:
+        float: Seconds, or None if the value is empty
+
+    Raises:
+        ValueError: If the value is not a valid timestamp
+    """
+    value = value.strip()
+    if not value:
+        return None
+
+    parts = value.split(':')
+    if len(parts) > 3:
+        raise ValueError(f"Invalid timestamp: {value}")
+
+    seconds = 0.0
+    for index, part in enumerate(parts):
+        # float() alone would also accept "nan", "inf" and "1e3"
+        if not TIMESTAMP_PART_RE.match(part):
+            raise ValueError(f"Invalid timestamp: {value}")
+        # Minutes and seconds after the leading field must stay below 60
+        if index and float(part) >= 60:
+            raise ValueError(f"Invalid timestamp: {value}")
+        seconds = seconds * 60 + float(part)
+
+    if not math.isfinite(seconds):
+        raise ValueError(f"Invalid timestamp: {value}")
+    return seconds
+
+
+def parse_clip_range(start, end, chapter):
+    """Build a ClipRange from the clip form fields.
+
+    Args:
+        start: Start timestamp text, may be empty
+        end: End timestamp text, may be empty
+        chapter: Chapter title regex, may be empty
+
+    Returns:
+        ClipRange: The requested clip, or None to download everything
+
+    Raises:
+        ValueError: If the timestamps are invalid
+        re.error: If the chapter pattern is not a valid regex
+    """
+    chapter = chapter.strip()
+    start = parse_timestamp(start)
+    end = parse_timestamp(end)
+
+    if chapter:
+        if start is not None or end is not None:
+            raise ValueError("Use either a time range or a chapter, not both.")
+        re.compile(chapter)
+        return ClipRange(0, float('inf'), chapter)
+
+    if start is None and end is None:
+        return None
+
+    start = start or 0
+    end = float('inf') if end is None else end
+    if end <= start:
+        raise ValueError("Clip end must be after clip start.")
+    return ClipRange(start, end, None)
+
+
+def clip_duration(clip, meta):
+    """Return how many seconds of the video a clip covers.
+
+    Args:
+        clip: ClipRange to measure
+        meta: VideoMeta of the video
+
+    Returns:
+        float: Covered seconds, or None if the duration is unknown
+    """
+    duration = meta.duration
+    if not duration:
+        return None
+
+    if clip.chapter:
+        pattern = re.compile(clip.chapter)
+        return sum(
+            min(end, duration) - start
+            for start, end, title in meta.chapters
+            if pattern.search(title)
+        )
+
+    end = min(clip.end, duration)
+    return max(end - clip.start, 0)
+
+
+def format_size(num_bytes):
+    """Format a byte count for display.
+
+    Args:
+        num_bytes: Size in bytes
+
+    Returns:
+        str: Human readable size, e.g. "12.3 MB"
+    """
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if num_bytes < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} TB"
+
+
+# ==================== RETRY & CIRCUIT BREAKER ====================
+# HTTP statuses worth retrying: timeouts, throttling and transient server errors
+RETRYABLE_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+# yt-dlp's own retries per request and per fragment within one attempt
+INNER_RETRIES = 3
+HTTP_STATUS_RE = re.compile(r'HTTP Error (\d{3})')
+
+# Error message fragments that mean the job can never succeed as-is
+FATAL_MESSAGES = (
+    'video unavailable', 'private video', 'sign in to confirm your age',
+    'members-only', 'has been removed', 'copyright', 'not available in your country',
+    'unsupported url', 'ffmpeg', 'ffprobe', 'no space left',
+)
+
+# Error message fragments for transient network trouble
+TRANSIENT_MESSAGES = (
+    'timed out', 'connection reset', 'connection aborted', 'connection refused',
+    'temporary failure', 'remote end closed', 'incompleteread', 'too many requests',
+    'unable to download video data', 'got server http error',
+    'bytes, expected',  # Truncated body, e.g. "Downloaded 5 bytes, expected 9 bytes"
+)
+
+
+def error_cause(error):
+    """Return the original exception wrapped by a yt-dlp DownloadError.
+
+    Args:
+        error: The caught exception
+
+    Returns:
+        Exception: The wrapped exception, or error itself
+    """
+    exc_info = getattr(error, 'exc_info', None)
+    if exc_info and exc_info[1] is not None:
+        return exc_info[1]
+    return error
+
+
+def error_status(error):
+    """Return the HTTP status behind an error, if any.
+
+    Args:
+        error: The caught exception
+
+    Returns:
+        int: HTTP status code, or None
+    """
+    cause = error_cause(error)
+    status = getattr(cause, 'status', None) or getattr(cause, 'code', None)
+    if isinstance(status, int):
+        return status
+
+    match = HTTP_STATUS_RE.search(str(error))
+    return int(match.group(1)) if match else None
+
+
+def error_host(error, default):
+    """Return the host an error came from.
+
+    yt-dlp extracts from youtube.com but streams from CDN hosts, so the
+    failing request's URL is used when the error carries one.
+
+    Args:
+        error: The caught exception
+        default: Host to use when the error has no URL
+
+    Returns:
+        str: Lower-case host name
+    """
+    cause = error_cause(error)
+    response = getattr(cause, 'response', None)
+    url = getattr(response, 'url', None) or getattr(cause, 'url', None)
+    host = urlsplit(url).hostname if isinstance(url, str) else None
+    return (host or default).lower()
+
+
+def stream_host(info):
+    """Return the host a processed video's media is streamed from.
+
+    Args:
+        info: yt-dlp info dict after format selection
+
+    Returns:
+        str: Host name, or None for playlists and unknown formats
+    """
+    formats = info.get('requested_formats') or [info]
+    url = formats[0].get('url')
+    return urlsplit(url).hostname if isinstance(url, str) else None
+
+
+def breaker_key(host):
+    """Return the key a host's circuit breaker is stored under.
+
+    Streaming CDN hosts (rr5---sn-abc.googlevideo.com) change between
+    attempts, so breakers are kept per registrable domain, approximated by
+    the last two labels. IP addresses are kept as they are.
+
+    Args:
+        host: Host name
+
+    Returns:
+        str: Lower-case breaker key
+    """
+    host = host.lower()
+    if ':' in host or host.replace('.', '').isdigit():
+        return host
+    return '.'.join(host.split('.')[-2:])
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter and retryable/fatal classification."""
+
+    def __init__(self, max_attempts=5, base_delay=2.0, max_delay=120.0):
+        """Initialize the retry policy.
+
+        Args:
+            max_attempts: Total attempts per job, including the first
+            base_delay: Delay in seconds before the first retry
+            max_delay: Upper bound on any single delay
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def is_retryable(self, error):
+        """Decide whether a failed attempt is worth retrying.
+
+        Args:
+            error: The caught exception
+
+        Returns:
+            bool: True for transient network/server errors
+        """
+        cause = error_cause(error)
+        if isinstance(cause, PermissionError):
+            return False
+
+        message = str(error).lower()
+        if any(text in message for text in FATAL_MESSAGES):
+            return False
+
+        status = error_status(error)
+        if status is not None:
+            return status in RETRYABLE_STATUSES
+
+        if isinstance(cause, (URLError, ConnectionError, socket.timeout, TimeoutError)):
+            return True
+        return any(text in message for text in TRANSIENT_MESSAGES)
+
+    def delay(self, attempt, error=None):
+        """Return how long to wait before the next attempt.
+
+        Args:
+            attempt: Number of attempts made so far (1 after the first failure)
+            error: The failure, used to honor a server Retry-After header
+
+        Returns:
+            float: Delay in seconds
+        """
+        retry_after = self.retry_after(error)
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def retry_after(self, error):
+        """Read a numeric Retry-After header from an HTTP error.
+
+        Args:
+            error: The caught exception, or None
+
+        Returns:
+            float: Seconds to wait, or None if not given
+        """
+        if error is None:
+            return None
+
+        cause = error_cause(error)
+        headers = getattr(getattr(cause, 'response', None), 'headers', None)
+        if headers is None:
+            headers = getattr(cause, 'headers', None)
+        value = headers.get('Retry-After') if headers is not None else None
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker that also throttles concurrency.
+
+    Repeated retryable failures trip the breaker: new attempts wait out a
+    cooldown and the host's concurrency limit is halved. After the cooldown
+    a single probe is let through; each success raises the limit by one
+    until it is back at the maximum.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, max_concurrency=4, failure_threshold=3, cooldown=30.0):
+        """Initialize the circuit breaker.
+
+        Args:
+            max_concurrency: Concurrent requests allowed while healthy
+            failure_threshold: Consecutive retryable failures before tripping
+            cooldown: Seconds to stay open after tripping
+        """
+        self.max_concurrency = max_concurrency
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+        self.state = self.CLOSED
+        self.limit = max_concurrency
+        self.failures = 0
+        self.active = 0
+        self.opened_at = 0.0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        """Block until the host may be contacted, then take a slot.
+
+        Returns:
+            int: The concurrency this attempt may use against the host
+        """
+        with self.condition:
+            while True:
+                if self.state == self.OPEN:
+                    remaining = self.opened_at + self.cooldown - time.monotonic()
+                    if remaining > 0:
+                        self.condition.wait(remaining)
+                        continue
+                    self.state = self.HALF_OPEN
+
+                # Half-open lets a single probe through
+                allowed = 1 if self.state == self.HALF_OPEN else self.limit
+                if self.active < allowed:
+                    self.active += 1
+                    return allowed
+                self.condition.wait()
+
+    def release(self, success, retryable=False):
+        """Return a slot and record the attempt's outcome.
+
+        Args:
+            success: Whether the attempt succeeded
+            retryable: Whether a failure was a transient/host-side one;
+                fatal errors are not the host's fault and are ignored
+        """
+        with self.condition:
+            self.active -= 1
+            if success:
+                self.failures = 0
+                self.state = self.CLOSED
+                self.limit = min(self.limit + 1, self.max_concurrency)
+            elif retryable:
+                self.failures += 1
+                if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                    self.trip()
+            self.condition.notify_all()
+
+    def trip(self):
+        """Open the breaker and halve the host's concurrency limit."""
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        self.failures = 0
+        self.limit = max(1, self.limit // 2)
+
+
+# ==================== OUTPUT PATHS ====================
+# Characters that are invalid in filenames on Windows, macOS or Linux
+INVALID_FILENAME_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+RESERVED_FILENAMES = {'CON', 'PRN', 'AUX', 'NUL'} | {
+    f"{prefix}{n}" for prefix in ('COM', 'LPT') for n in range(1, 10)
+}
+MAX_FILENAME_BYTES = 200  # Leaves room for suffixes under the 255-byte limit
+
+
+def sanitize_filename(name):
+    """Make a video title safe to use as a filename on any platform.
+
+    Shared by thumbnails and media so both get the same names.
+
+    Args:
+        name: The raw title
+
+    Returns:
+        str: A non-empty filename stem without an extension
+    """
+    name = INVALID_FILENAME_RE.sub('', name or '').strip()
+
+    # Truncate on the UTF-8 byte length, which is what filesystems limit
+    encoded = name.encode('utf-8')
+    if len(encoded) > MAX_FILENAME_BYTES:
+        name = encoded[:MAX_FILENAME_BYTES].decode('utf-8', 'ignore')
+
+    name = name.rstrip('. ')
+    if name.upper() in RESERVED_FILENAMES:
+        name += '_'
+    return name or 'untitled'
+
+
+class OutputPathPlanner:
+    """Hands out unique output paths without probing the disk per file.
+
+    Each directory is listed once and kept as an in-memory index that our
+    own reservations update. Collisions get `_1`, `_2`, ... suffixes, with
+    the next free counter remembered so huge libraries don't rescan from 1.
+    Reservations are atomic across concurrent jobs.
+    """
+
+    def __init__(self):
+        """Initialize an empty planner."""
+        self.lock = threading.Lock()
+        self.index = {}        # directory -> set of casefolded filenames
+        self.next_suffix = {}  # (directory, stem, ext) -> next counter to try
+        self.owners = {}       # (directory, owner) -> reserved path
+
+    def scan(self, directory):
+        """Return the filename index of a directory, listing it on first use.
+
+        Must be called with the lock held.
+
+        Args:
+            directory: Absolute directory path
+
+        Returns:
+            set: Casefolded names of the files in the directory
+        """
+        names = self.index.get(directory)
+        if names is None:
+            with os.scandir(directory) as entries:
+                names = {entry.name.casefold() for entry in entries}
+            self.index[directory] = names
+        return names
+
+    def reserve(self, directory, stem, ext, owner=None):
+        """Reserve a unique path in a directory.
+
+        Args:
+            directory: Target directory
+            stem: Desired filename without extension (already sanitized)
+            ext: Extension including the dot, e.g. ".mp4"
+            owner: Optional key (such as a video ID); reserving again for
+                the same owner returns the same path, so retried downloads
+                resume into the same file
+
+        Returns:
+            str: The reserved absolute path
+        """
+        directory = os.path.abspath(directory)
+
+        with self.lock:
+            if owner is not None and (directory, owner) in self.owners:
+                return self.owners[(directory, owner)]
+
+            names = self.scan(directory)
+            candidate = f"{stem}{ext}"
+
+            if candidate.casefold() in names:
+                key = (directory, stem.casefold(), ext.casefold())
+                counter = self.next_suffix.get(key, 1)
+                while True:
+                    candidate = f"{stem}_{counter}{ext}"
+                    counter += 1
+                    if candidate.casefold() not in names:
+                        break
+                self.next_suffix[key] = counter
+
+            names.add(candidate.casefold())
+            path = os.path.join(directory, candidate)
+            if owner is not None:
+                self.owners[(directory, owner)] = path
+            return path
+
+    def add(self, path):
+        """Record a file that now exists, so it is never handed out.
+
+        Called for every file a download actually wrote (playlist entries,
+        chapter clips, post-processed audio) and for names found taken when
+        publishing.
+
+        Args:
+            path: Path of the existing file
+        """
+        directory, name = os.path.split(os.path.abspath(path))
+        with self.lock:
+            names = self.index.get(directory)
+            if names is not None:
+                names.add(name.casefold())
+
+    def forget(self, directory):
+        """Drop a directory's index so it is listed again on next use.
+
+        Args:
+            directory: Directory to rescan
+        """
+        directory = os.path.abspath(directory)
+        with self.lock:
+            self.index.pop(directory, None)
+            self.next_suffix = {
+                key: value for key, value in self.next_suffix.items()
+                if key[0] != directory
+            }
+            self.owners = {
+                key: value for key, value in self.owners.items()
+                if key[0] != directory
+            }
+
+
+def publish_file(source, target):
+    """Move a file to its final name without overwriting anything.
+
+    A hard link claims the name atomically. Filesystems without hard links
+    (FAT, some network mounts) claim it with an exclusively created
+    placeholder that the file is then renamed over; the placeholder is
+    removed again if the rename fails.
+
+    Args:
+        source: File to move
+        target: Final path
+
+    Raises:
+        FileExistsError: Something already exists at target
+        OSError: With errno EXDEV when source and target are on different
+            mounts (e.g. a bind mount of the same device) and must be copied
+    """
+    try:
+        os.link(source, target)
+    except FileExistsError:
+        raise
+    except OSError as e:
+        if e.errno == errno.EXDEV:
+            raise
+        with open(target, 'xb'):
+            pass
+        try:
+            os.replace(source, target)
+        except OSError:
+            os.remove(target)
+            raise
+        return
+    os.remove(source)
+
+
+# ==================== DEVICE WRITE SCHEDULING ====================
+MAX_PARALLEL_DOWNLOADS = 3  # Jobs downloading at the same time
+STAGING_ENV_VAR = 'YOUTUBE_DOWNLOADER_STAGING'  # Overrides the staging directory
+MAX_WRITERS_PER_DEVICE = 1  # Concurrent file copies onto one storage device
+WRITE_BUFFER_SIZE = 8 * 1024 * 1024  # Bytes per sequential write
+
+
+class DeviceWriteScheduler:
+    """Groups output writes by storage device and measures their throughput.
+
+    yt-dlp writes small, interleaved chunks. Downloads are therefore staged
+    on the local disk and each finished file is copied to its output root in
+    large sequential writes, with at most `max_writers` copies per
+    underlying device (st_dev) at a time. Spinning disks and network mounts
+    see one long sequential stream instead of several random ones. Roots
+    on the staging device get the finished file linked in instead.
+    """
+
+    def __init__(self, staging_dir, max_writers=MAX_WRITERS_PER_DEVICE,
+                 buffer_size=WRITE_BUFFER_SIZE):
+        """Initialize the scheduler.
+
+        Args:
+            staging_dir: Local directory downloads are staged in
+            max_writers: Concurrent writers allowed per device
+            buffer_size: Size in bytes of each write
+        """
+        self.staging_dir = Path(staging_dir)
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+        self.max_writers = max_writers
+        self.buffer_size = buffer_size
+
+        self.lock = threading.Lock()
+        self.writers = {}  # device -> Semaphore
+        self.stats = {}    # device -> [label, bytes written, seconds spent]
+
+    def device_of(self, path):
+        """Return the ID of the device a path lives on.
+
+        Args:
+            path: An existing file or directory
+
+        Returns:
+            int: The st_dev of the path
+        """
+        return os.stat(path).st_dev
+
+    def staging_folder(self, directory):
+        """Return the folder downloads for an output root are staged in.
+
+        Each output root gets its own staging subfolder so equal names in
+        different roots don't collide.
+
+        Args:
+            directory: Output root
+
+        Returns:
+            str: Folder inside the staging directory
+        """
+        folder = self.staging_dir / hashlib.md5(directory.encode('utf-8')).hexdigest()[:12]
+        folder.mkdir(parents=True, exist_ok=True)
+        return str(folder)
+
+    def staging_path(self, target_path):
+        """Return where to stage a file that will end up at target_path.
+
+        Args:
+            target_path: Final path of the file
+
+        Returns:
+            str: Path inside the staging directory
+        """
+        directory, name = os.path.split(target_path)
+        return os.path.join(self.staging_folder(directory), name)
+
+    def writer_slot(self, device):
+        """Return the semaphore limiting writers on a device.
+
+        Args:
+            device: Device ID
+
+        Returns:
+            threading.Semaphore: The device's writer slots
+        """
+        with self.lock:
+            if device not in self.writers:
+                self.writers[device] = threading.Semaphore(self.max_writers)
+            return self.writers[device]
+
+    def commit(self, source, target):
+        """Move a finished download from staging to its output root.
+
+        Files on the same device are linked into place without copying.
+        Cross-device copies go to a unique `.part` file first and are synced
+        before being published, so a crash or full disk never leaves a
+        truncated file under the final name. An existing target is never
+        overwritten; the staged file is kept so the caller can pick
+        another name.
+
+        Args:
+            source: Staged file
+            target: Final path
+
+        Raises:
+            FileExistsError: Something already exists at target
+        """
+        directory, name = os.path.split(target)
+        device = self.device_of(directory)
+        if device == self.device_of(source):
+            try:
+                publish_file(source, target)
+                return
+            except OSError as e:
+                # Same device but another mount (bind mounts): copy instead
+                if e.errno != errno.EXDEV:
+                    raise
+
+        buffer = bytearray(self.buffer_size)
+        view = memoryview(buffer)
+        written = 0
+
+        with self.writer_slot(device):
+            started = time.monotonic()
+            # A unique name, so a partial left by an earlier crash can't
+            # be mistaken for the target being taken
+            fd, partial = tempfile.mkstemp(prefix=name + '.', suffix='.part',
+                                           dir=directory)
+            with open(source, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+                try:
+                    while True:
+                        size = src.readinto(buffer)
+                        if not size:
+                            break
+                        dst.write(view[:size])
+                        written += size
+                    dst.flush()
+                    os.fsync(dst.fileno())
+                except BaseException:
+                    dst.close()
+                    os.remove(partial)
+                    raise
+            elapsed = time.monotonic() - started
+
+        shutil.copystat(source, partial)
+        try:
+            publish_file(partial, target)
+        except OSError:
+            os.remove(partial)
+            raise
+        os.remove(source)
+        self.record(device, directory, written, elapsed)
+
+    def record(self, device, label, written, elapsed):
+        """Add a finished write to a device's statistics.
+
+        Args:
+            device: Device ID
+            label: Directory shown for the device in reports
+            written: Bytes written
+            elapsed: Seconds the write took
+        """
+        with self.lock:
+            stats = self.stats.setdefault(device, [label, 0, 0.0])
+            stats[1] += written
+            stats[2] += elapsed
+
+    def reset_stats(self):
+        """Start a new measurement period (one per download run)."""
+        with self.lock:
+            self.stats = {}
+
+    def report(self):
+        """Describe the write throughput of every device written to.
+
+        Returns:
+            list: One line per device
+        """
+        with self.lock:
+            lines = []
+            for label, written, elapsed in self.stats.values():
+                rate = written / elapsed if elapsed else 0
+                lines.append(
+                    f"{label}: {format_size(written)} at {format_size(rate)}/s"
+                )
+            return lines
+
+
 class YouTubeDownloader:
     """Main application class for YouTube Downloader."""
 
@@ -51,11 +1099,11 @@ class YouTubeDownloader:
         """
         self.root = root
         self.root.title("YouTube Downloader")
-        self.root.geometry("950x420")  # CÓ THỂ THAY ĐỔI - You can change window size (width x height) | Có thể điều chỉnh kích thước cửa sổ (chiều rộng x chiều cao)
+        self.root.geometry("950x500")  # CÓ THỂ THAY ĐỔI - You can change window size (width x height) | Có thể điều chỉnh kích thước cửa sổ (chiều rộng x chiều cao)
         self.root.resizable(True, True)
         
         # Set minimum window size
-        self.root.minsize(850, 420)  # CÓ THỂ THAY ĐỔI - Minimum window size | Kích thước tối thiểu của cửa sổ
+        self.root.minsize(850, 500)  # CÓ THỂ THAY ĐỔI - Minimum window size | Kích thước tối thiểu của cửa sổ
 
 
         # Variables
@@ -66,14 +1114,44 @@ class YouTubeDownloader:
         self.format_var = tk.StringVar(value="mp4")
         self.progress_var = tk.DoubleVar()
         self.progress_label_var = tk.StringVar(value="0%")
+        self.clip_start_var = tk.StringVar()
+        self.clip_end_var = tk.StringVar()
+        self.clip_chapter_var = tk.StringVar()
+        self.status_var = tk.StringVar()
 
         # Thumbnail
         self.thumbnail_label = None
         self.thumbnail_path = None
-        self.video_title = None  # Store video title for thumbnail filename
+        self.video_meta = None  # Metadata of the previewed video
+
+        # VideoMeta of fetched/downloaded videos, keyed by canonical URL
+        self.meta_cache = {}
+
+        # Unique output filenames shared by thumbnails and downloads
+        self.path_planner = OutputPathPlanner()
+
+        # Staged, per-device batched writes to the output roots. Staging
+        # should be on a fast local disk with room for the largest download
+        self.write_scheduler = DeviceWriteScheduler(
+            os.environ.get(STAGING_ENV_VAR)
+            or Path.home() / '.youtube_downloader_temp' / 'staging'
+        )
 
         # Download state
         self.is_downloading = False
+        # Jobs of the current run, for the overall progress bar
+        self.progress_lock = threading.Lock()
+        self.jobs = []
+
+        # Retry policy and per-host circuit breakers shared by all jobs
+        self.retry_policy = RetryPolicy()
+        self.breakers = {}
+        self.breakers_lock = threading.Lock()
+
+        # Queue of canonical URLs imported in bulk
+        self.download_queue = []
+        self.queued_urls = set()
+        self.queue_label_var = tk.StringVar(value="Queue: 0")
         
         # Setup colors and styles
         self.setup_styles()
@@ -293,14 +1371,33 @@ class YouTubeDownloader:
         )
         paste_btn.grid(row=0, column=2, padx=(5, 0), pady=(0, 10))
 
-        # Fetch Thumbnail Button
+        # Fetch Info / Bulk Import Buttons
+        action_frame = ttk.Frame(input_section)
+        action_frame.grid(row=1, column=0, columnspan=3, pady=(0, 10))
+
         fetch_thumb_btn = ttk.Button(
-            input_section,
+            action_frame,
             text="🔍 Fetch Info",
             command=self.fetch_thumbnail_threaded,
             width=15
         )
-        fetch_thumb_btn.grid(row=1, column=0, columnspan=3, pady=(0, 10))
+        fetch_thumb_btn.pack(side=tk.LEFT, padx=(0, 5))
+
+        import_clip_btn = ttk.Button(
+            action_frame,
+            text="📋 Import Clipboard",
+            command=self.import_urls_from_clipboard
+        )
+        import_clip_btn.pack(side=tk.LEFT, padx=(0, 5))
+
+        import_file_btn = ttk.Button(
+            action_frame,
+            text="📂 Import File",
+            command=self.import_urls_from_file
+        )
+        import_file_btn.pack(side=tk.LEFT, padx=(0, 10))
+
+        ttk.Label(action_frame, textvariable=self.queue_label_var).pack(side=tk.LEFT)
 
         # Directory Selection
         ttk.Label(input_section, text="Save To:", font=("Helvetica", 11, "bold")).grid(
@@ -310,10 +1407,16 @@ class YouTubeDownloader:
             input_section, textvariable=self.directory_var, font=("Helvetica", 11)
         )
         dir_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=(0, 10))
+        dir_buttons = ttk.Frame(input_section)
+        dir_buttons.grid(row=2, column=2, padx=(5, 0), pady=(0, 10))
         browse_btn = ttk.Button(
-            input_section, text="📁 Browse", command=self.browse_directory, width=9
+            dir_buttons, text="📁 Browse", command=self.browse_directory, width=9
         )
-        browse_btn.grid(row=2, column=2, padx=(5, 0), pady=(0, 10))
+        browse_btn.pack(side=tk.LEFT)
+        add_dir_btn = ttk.Button(
+            dir_buttons, text="➕", command=self.add_output_root, width=3
+        )
+        add_dir_btn.pack(side=tk.LEFT, padx=(5, 0))
 
         # Format Selection
         ttk.Label(input_section, text="Format:", font=("Helvetica", 11, "bold")).grid(
@@ -336,9 +1439,29 @@ class YouTubeDownloader:
             value="mp3"
         ).pack(side=tk.LEFT)
 
+        # Clip Selection (optional time range or chapter)
+        ttk.Label(input_section, text="Clip:", font=("Helvetica", 11, "bold")).grid(
+            row=4, column=0, sticky=tk.W, pady=(10, 0), padx=(0, 10)
+        )
+        clip_container = ttk.Frame(input_section)
+        clip_container.grid(row=4, column=1, columnspan=2, sticky=tk.W, pady=(10, 0))
+
+        ttk.Label(clip_container, text="Start").pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Entry(
+            clip_container, textvariable=self.clip_start_var, width=9
+        ).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Label(clip_container, text="End").pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Entry(
+            clip_container, textvariable=self.clip_end_var, width=9
+        ).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Label(clip_container, text="Chapter").pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Entry(
+            clip_container, textvariable=self.clip_chapter_var, width=12
+        ).pack(side=tk.LEFT)
+
         # Download Button (centered)
         button_frame = ttk.Frame(input_section)
-        button_frame.grid(row=4, column=0, columnspan=3, pady=(15, 0))
+        button_frame.grid(row=5, column=0, columnspan=3, pady=(15, 0))
         
         self.download_btn = ttk.Button(
             button_frame,
@@ -349,6 +1472,15 @@ class YouTubeDownloader:
         )
         self.download_btn.pack()
 
+        # Status line (clip estimates, retries, write throughput)
+        ttk.Label(
+            button_frame,
+            textvariable=self.status_var,
+            foreground=self.colors['text_secondary'],
+            wraplength=380,
+            justify=tk.CENTER
+        ).pack(pady=(8, 0))
+
 
         # ==================== RIGHT COLUMN: THUMBNAIL SECTION ====================
         thumbnail_frame = ttk.LabelFrame(
@@ -391,14 +1523,40 @@ class YouTubeDownloader:
 
     def browse_directory(self):
         """Open directory selection dialog."""
+        roots = self.get_output_roots()
         directory = filedialog.askdirectory(
-            initialdir=self.directory_var.get(),
+            initialdir=roots[0] if roots else None,
             title="Select Download Directory"
         )
         if directory:
             self.directory_var.set(directory)
+            self.path_planner.forget(directory)
             self.log_message(f"Download directory set to: {directory}")
 
+    def add_output_root(self):
+        """Add another output root; queued jobs are spread across all roots."""
+        directory = filedialog.askdirectory(title="Add Download Directory")
+        if directory and directory not in self.get_output_roots():
+            self.directory_var.set(
+                os.pathsep.join(self.get_output_roots() + [directory])
+            )
+            self.path_planner.forget(directory)
+            self.log_message(f"Added download directory: {directory}")
+
+    def get_output_roots(self):
+        """Return the output roots entered in the Save To field.
+
+        Several roots are separated by the platform path separator
+        (';' on Windows, ':' elsewhere).
+
+        Returns:
+            list: Directory paths
+        """
+        return [
+            root.strip() for root in self.directory_var.get().split(os.pathsep)
+            if root.strip()
+        ]
+
     def log_message(self, message):
         """Add a message to the log text area.
 
@@ -409,6 +1567,14 @@ class YouTubeDownloader:
         pass
 
 
+    def set_status(self, message):
+        """Show a message in the status line; safe to call from any thread.
+
+        Args:
+            message: The text to show
+        """
+        self.root.after(0, self.status_var.set, message)
+
     def update_progress(self, percentage):
         """Update the progress bar and label.
 
@@ -430,8 +1596,80 @@ class YouTubeDownloader:
         if not url or not url.strip():
             return False
 
-        valid_domains = ['youtube.com', 'youtu.be', 'www.youtube.com']
-        return any(domain in url.lower() for domain in valid_domains)
+        return parse_youtube_url(url) is not None
+
+    def add_to_queue(self, urls):
+        """Add canonical URLs to the download queue, skipping duplicates.
+
+        Args:
+            urls: Iterable of canonical URLs
+
+        Returns:
+            int: Number of URLs actually added
+        """
+        added = 0
+        for url in urls:
+            if url not in self.queued_urls:
+                self.queued_urls.add(url)
+                self.download_queue.append(url)
+                added += 1
+        self.queue_label_var.set(f"Queue: {len(self.download_queue)}")
+        return added
+
+    def import_urls(self, text, source):
+        """Normalize, de-duplicate and queue all YouTube links found in text.
+
+        Args:
+            text: Plain text or HTML containing links
+            source: Human-readable name of where the text came from
+        """
+        urls = extract_youtube_urls(text)
+        if not urls:
+            messagebox.showwarning(
+                "Nothing Imported",
+                f"No YouTube links were found in the {source}."
+            )
+            return
+
+        added = self.add_to_queue(urls)
+        self.log_message(
+            f"Imported {added} new URL(s) from {source} "
+            f"({len(urls) - added} already queued)"
+        )
+        messagebox.showinfo(
+            "Import Complete",
+            f"Added {added} video(s) to the queue.\n"
+            f"Skipped {len(urls) - added} duplicate(s)."
+        )
+
+    def import_urls_from_clipboard(self):
+        """Import YouTube links from the clipboard into the queue."""
+        try:
+            text = self.root.clipboard_get()
+        except tk.TclError:
+            messagebox.showwarning("Clipboard Empty", "The clipboard has no text.")
+            return
+        self.import_urls(text, "clipboard")
+
+    def import_urls_from_file(self):
+        """Import YouTube links from a text or HTML file into the queue."""
+        path = filedialog.askopenfilename(
+            title="Import URLs",
+            filetypes=[
+                ("Text and HTML files", "*.txt *.html *.htm *.csv"),
+                ("All files", "*.*"),
+            ]
+        )
+        if not path:
+            return
+
+        try:
+            with open(path, encoding='utf-8', errors='replace') as f:
+                text = f.read()
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to read file:\n{e}")
+            return
+        self.import_urls(text, os.path.basename(path))
 
     def fetch_thumbnail_threaded(self):
         """Start thumbnail fetch in a separate thread."""
@@ -458,56 +1696,62 @@ class YouTubeDownloader:
                 'extract_flat': False,
             }
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                thumbnail_url = info.get('thumbnail')
+            parsed = parse_youtube_url(url)
+            cache_key = parsed.canonical if parsed else url
+            meta = self.meta_cache.get(cache_key)
+            if meta is None:
+                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                    meta = VideoMeta.from_info(ydl.extract_info(url, download=False))
+                self.meta_cache[cache_key] = meta
 
-                if thumbnail_url:
-                    self.log_message(f"Downloading thumbnail from: {thumbnail_url}")
+            thumbnail_url = meta.thumbnail
 
-                    # Download thumbnail to temp location
-                    temp_dir = Path.home() / '.youtube_downloader_temp'
-                    temp_dir.mkdir(exist_ok=True)
-                    self.thumbnail_path = temp_dir / 'thumbnail.jpg'
+            if thumbnail_url:
+                self.log_message(f"Downloading thumbnail from: {thumbnail_url}")
 
-                    urlretrieve(thumbnail_url, self.thumbnail_path)
+                # Download thumbnail to temp location
+                temp_dir = Path.home() / '.youtube_downloader_temp'
+                temp_dir.mkdir(exist_ok=True)
+                self.thumbnail_path = temp_dir / 'thumbnail.jpg'
 
-                    # Load and display thumbnail with fixed size
-                    image = Image.open(self.thumbnail_path)
-                    
-                    # Create a fixed-size canvas
-                    canvas_width = 360  # CÓ THỂ THAY ĐỔI - Thumbnail display width | Chiều rộng hiển thị thumbnail
-                    canvas_height = 200  # CÓ THỂ THAY ĐỔI - Thumbnail display height | Chiều cao hiển thị thumbnail
-                    canvas = Image.new('RGB', (canvas_width, canvas_height), '#F5F7FA')
-                    
-                    # Resize image to fit while maintaining aspect ratio
-                    image.thumbnail((canvas_width, canvas_height), Image.Resampling.LANCZOS)
-                    
-                    # Center the image on canvas
-                    offset_x = (canvas_width - image.width) // 2
-                    offset_y = (canvas_height - image.height) // 2
-                    canvas.paste(image, (offset_x, offset_y))
-                    
-                    photo = ImageTk.PhotoImage(canvas)
+                urlretrieve(thumbnail_url, self.thumbnail_path)
 
-                    # Update label with image (without changing size)
-                    self.thumbnail_label.configure(image=photo, text="")
-                    self.thumbnail_label.image = photo  # Keep a reference
-                    
-                    # Enable Save Thumbnail button
-                    self.save_thumb_btn.configure(state=tk.NORMAL)
-                    
-                    # Store video title for thumbnail filename
-                    self.video_title = info.get('title', 'Unknown')
+                # Load and display thumbnail with fixed size
+                image = Image.open(self.thumbnail_path)
+                
+                # Create a fixed-size canvas
+                canvas_width = 360  # CÓ THỂ THAY ĐỔI - Thumbnail display width | Chiều rộng hiển thị thumbnail
+                canvas_height = 200  # CÓ THỂ THAY ĐỔI - Thumbnail display height | Chiều cao hiển thị thumbnail
+                canvas = Image.new('RGB', (canvas_width, canvas_height), '#F5F7FA')
+                
+                # Resize image to fit while maintaining aspect ratio
+                image.thumbnail((canvas_width, canvas_height), Image.Resampling.LANCZOS)
+                
+                # Center the image on canvas
+                offset_x = (canvas_width - image.width) // 2
+                offset_y = (canvas_height - image.height) // 2
+                canvas.paste(image, (offset_x, offset_y))
+                
+                photo = ImageTk.PhotoImage(canvas)
 
-                    self.log_message("Thumbnail loaded successfully!")
-                    self.log_message(f"Video Title: {self.video_title}")
-                    self.log_message(
-                        f"Duration: {info.get('duration', 0) // 60} minutes"
-                    )
-                else:
-                    self.log_message("No thumbnail available for this video.")
-                    self.save_thumb_btn.configure(state=tk.DISABLED)
+                # Update label with image (without changing size)
+                self.thumbnail_label.configure(image=photo, text="")
+                self.thumbnail_label.image = photo  # Keep a reference
+                
+                # Enable Save Thumbnail button
+                self.save_thumb_btn.configure(state=tk.NORMAL)
+                
+                # Store metadata for thumbnail filename
+                self.video_meta = meta
+
+                self.log_message("Thumbnail loaded successfully!")
+                self.log_message(f"Video Title: {meta.title}")
+                self.log_message(
+                    f"Duration: {(meta.duration or 0) // 60} minutes"
+                )
+            else:
+                self.log_message("No thumbnail available for this video.")
+                self.save_thumb_btn.configure(state=tk.DISABLED)
 
         except URLError as e:
             self.log_message(f"Network error while fetching thumbnail: {e}")
@@ -531,8 +1775,9 @@ class YouTubeDownloader:
             return
 
         try:
-            # Get download directory
-            download_dir = self.directory_var.get()
+            # Get download directory (the first root when there are several)
+            roots = self.get_output_roots()
+            download_dir = roots[0] if roots else ''
             
             # Validate directory
             if not download_dir or not os.path.exists(download_dir):
@@ -543,28 +1788,26 @@ class YouTubeDownloader:
                 return
             
             # Create filename from video title (sanitize for filesystem)
-            if self.video_title:
-                # Remove invalid characters for filename
-                safe_title = re.sub(r'[<>:"/\\|?*]', '', self.video_title)
-                filename = f"{safe_title}_thumbnail.jpg"
+            if self.video_meta and self.video_meta.title:
+                stem = f"{sanitize_filename(self.video_meta.title)}_thumbnail"
             else:
                 # Use timestamp if no title available
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"thumbnail_{timestamp}.jpg"
-            
-            # Full save path
-            save_path = os.path.join(download_dir, filename)
-            
-            # Handle duplicate filenames
-            counter = 1
-            base_path = save_path
-            while os.path.exists(save_path):
-                name, ext = os.path.splitext(base_path)
-                save_path = f"{name}_{counter}{ext}"
-                counter += 1
-            
-            # Copy thumbnail to download directory
-            shutil.copy2(self.thumbnail_path, save_path)
+                stem = f"thumbnail_{timestamp}"
+
+            # Reserve a unique save path (handles duplicate filenames) and
+            # create it exclusively, moving on if the name was taken since
+            # the directory was indexed
+            while True:
+                save_path = self.path_planner.reserve(download_dir, stem, '.jpg')
+                try:
+                    with open(self.thumbnail_path, 'rb') as src, \
+                            open(save_path, 'xb') as dst:
+                        shutil.copyfileobj(src, dst)
+                    break
+                except FileExistsError:
+                    continue
+            shutil.copystat(self.thumbnail_path, save_path)
             
             self.log_message(f"💾 Thumbnail saved to: {save_path}")
             messagebox.showinfo(
@@ -582,17 +1825,19 @@ class YouTubeDownloader:
     def start_download(self):
         """Validate inputs and start download in a separate thread."""
         url = self.url_var.get().strip()
-        directory = self.directory_var.get().strip()
+        directories = self.get_output_roots()
 
-        # Validation
-        if not self.validate_url(url):
+        # Validation - an empty URL field is fine when the queue has items
+        if url and self.validate_url(url):
+            self.add_to_queue([parse_youtube_url(url).canonical])
+        elif url or not self.download_queue:
             messagebox.showerror(
                 "Invalid URL",
                 "Please enter a valid YouTube URL."
             )
             return
 
-        if not directory or not os.path.exists(directory):
+        if not directories or not all(os.path.isdir(d) for d in directories):
             messagebox.showerror(
                 "Invalid Directory",
                 "Please select a valid download directory."
@@ -606,38 +1851,144 @@ class YouTubeDownloader:
             )
             return
 
+        try:
+            clip = self.get_clip_range()
+        except (ValueError, re.error) as e:
+            messagebox.showerror("Invalid Clip", str(e))
+            return
+
+        # Take the whole queue for this run
+        urls = self.download_queue
+        self.download_queue = []
+        self.queued_urls = set()
+        self.queue_label_var.set("Queue: 0")
+
         # Start download in separate thread
         self.is_downloading = True
         self.download_btn.configure(state=tk.DISABLED)
         self.update_progress(0)
+        self.status_var.set("")
 
         download_thread = threading.Thread(
-            target=self.download_video,
-            args=(url, directory),
+            target=self.run_download_queue,
+            args=(urls, directories, clip),
             daemon=True
         )
         download_thread.start()
 
-    def progress_hook(self, d):
+    def get_clip_range(self):
+        """Read the clip fields from the form.
+
+        Returns:
+            ClipRange: The requested clip, or None to download everything
+
+        Raises:
+            ValueError: If the timestamps are invalid
+            re.error: If the chapter pattern is not a valid regex
+        """
+        return parse_clip_range(
+            self.clip_start_var.get(),
+            self.clip_end_var.get(),
+            self.clip_chapter_var.get(),
+        )
+
+    def run_download_queue(self, urls, directories, clip=None):
+        """Download queued URLs with a small pool of parallel workers.
+
+        Jobs are spread round-robin across the output roots. Per-video
+        popups are only shown for single downloads; batches report a summary
+        with per-device write throughput when they finish.
+
+        Args:
+            urls: Canonical URLs to download
+            directories: Output roots to save the downloaded files to
+            clip: Optional ClipRange applied to every video
+        """
+        notify = len(urls) == 1
+        failed = []
+        run_jobs = plan_jobs(urls, directories, clip)
+        pending = queue.Queue()
+        for index, job in enumerate(run_jobs, 1):
+            pending.put((index, job))
+
+        with self.progress_lock:
+            self.jobs = run_jobs
+        self.write_scheduler.reset_stats()
+
+        def worker():
+            while True:
+                try:
+                    index, job = pending.get_nowait()
+                except queue.Empty:
+                    return
+                if not notify:
+                    self.log_message(f"[{index}/{len(urls)}] {job.url} -> {job.directory}")
+                if not self.download_video(job, notify=notify):
+                    failed.append(job.url)
+                self.report_job_progress(job, 100)
+
+        try:
+            workers = [
+                threading.Thread(target=worker, daemon=True)
+                for _ in range(min(MAX_PARALLEL_DOWNLOADS, len(urls)))
+            ]
+            for thread in workers:
+                thread.start()
+            for thread in workers:
+                thread.join()
+
+            throughput = self.write_scheduler.report()
+            for line in throughput:
+                self.log_message(f"Disk write: {line}")
+            if throughput:
+                self.set_status("Write throughput: " + "; ".join(throughput))
+
+            if not notify:
+                summary = f"Downloaded {len(urls) - len(failed)} of {len(urls)} video(s)."
+                if throughput:
+                    summary += "\n\nWrite throughput:\n" + "\n".join(throughput)
+                self.root.after(0, messagebox.showinfo, "Queue Finished", summary)
+        finally:
+            # Re-enable download button
+            self.is_downloading = False
+            self.root.after(0, self.download_btn.configure, {'state': tk.NORMAL})
+
+    def report_job_progress(self, job, percentage):
+        """Record a job's progress and update the overall progress bar.
+
+        Args:
+            job: The DownloadJob reporting
+            percentage: Progress of the job (0-100)
+        """
+        with self.progress_lock:
+            job.progress = percentage
+            overall = sum(j.progress for j in self.jobs) / max(len(self.jobs), 1)
+        self.root.after(0, self.update_progress, overall)
+
+    def progress_hook(self, job, d):
         """Hook for yt-dlp to report download progress.
 
+        Bound to its job with functools.partial.
+
         Args:
+            job: The DownloadJob being downloaded
             d: Dictionary containing download status information
         """
         if d['status'] == 'downloading':
             try:
                 # Calculate percentage more accurately
                 downloaded_bytes = d.get('downloaded_bytes', 0)
+                job.record_bytes(d.get('filename'), downloaded_bytes)
                 total_bytes = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
-                
+
                 if total_bytes > 0:
                     percentage = (downloaded_bytes / total_bytes) * 100
-                    self.root.after(0, self.update_progress, percentage)
+                    self.report_job_progress(job, percentage)
                 else:
                     # Fallback to string parsing if bytes not available
                     percent_str = d.get('_percent_str', '0%').strip().replace('%', '')
                     percentage = float(percent_str)
-                    self.root.after(0, self.update_progress, percentage)
+                    self.report_job_progress(job, percentage)
 
 
                     
@@ -645,16 +1996,25 @@ class YouTubeDownloader:
                 pass
 
         elif d['status'] == 'finished':
-            self.root.after(0, self.update_progress, 100)
+            self.report_job_progress(job, 100)
             self.root.after(0, self.log_message, "✓ Download finished. Processing...")
 
-    def download_video(self, url, directory):
+    def download_video(self, job, notify=True):
         """Download video using yt-dlp.
 
         Args:
-            url: YouTube URL to download
-            directory: Directory to save the downloaded file
+            job: DownloadJob with the URL, output directory and optional
+                ClipRange (only the covering part is fetched)
+            notify: Show a message box on success or failure
+
+        Returns:
+            bool: True if the download succeeded
         """
+        url = job.url
+        directory = job.directory
+        clip = job.clip
+        progress_hook = functools.partial(self.progress_hook, job)
+
         try:
             self.log_message(f"Starting download from: {url}")
             self.log_message(f"Saving to: {directory}")
@@ -665,8 +2025,9 @@ class YouTubeDownloader:
                 # Best quality video with audio
                 ydl_opts = {
                     'format': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
-                    'outtmpl': os.path.join(directory, '%(title)s.%(ext)s'),
-                    'progress_hooks': [self.progress_hook],
+                    'paths': {'home': directory},
+                    'outtmpl': '%(title)s.%(ext)s',
+                    'progress_hooks': [progress_hook],
                     'merge_output_format': 'mp4',
                 }
                 self.log_message("Format: MP4 (Best Quality Video)")
@@ -675,8 +2036,9 @@ class YouTubeDownloader:
                 # Audio only, extract as MP3
                 ydl_opts = {
                     'format': 'bestaudio/best',
-                    'outtmpl': os.path.join(directory, '%(title)s.%(ext)s'),
-                    'progress_hooks': [self.progress_hook],
+                    'paths': {'home': directory},
+                    'outtmpl': '%(title)s.%(ext)s',
+                    'progress_hooks': [progress_hook],
                     'postprocessors': [{
                         'key': 'FFmpegExtractAudio',
                         'preferredcodec': 'mp3',
@@ -685,36 +2047,42 @@ class YouTubeDownloader:
                 }
                 self.log_message("Format: MP3 (Audio Only)")
 
+            if clip:
+                self.apply_clip_options(ydl_opts, clip)
+
             # Download
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=True)
-                filename = ydl.prepare_filename(info)
-
-                # For MP3, the extension changes after processing
-                if format_choice == "mp3":
-                    filename = os.path.splitext(filename)[0] + '.mp3'
-
-                self.log_message("=" * 50)
-                self.log_message("✓ Download completed successfully!")
-                self.log_message(f"File saved as: {os.path.basename(filename)}")
-                self.log_message("=" * 50)
-
-                # Show success message
-                self.root.after(
-                    0,
-                    messagebox.showinfo,
-                    "Success",
-                    f"Download completed!\n\nFile: {os.path.basename(filename)}"
-                )
+            meta, filename = self.download_with_retry(
+                job, ydl_opts, f".{format_choice}"
+            )
+            self.meta_cache[url] = meta
+
+            # For MP3, the extension changes after processing
+            if format_choice == "mp3":
+                filename = os.path.splitext(filename)[0] + '.mp3'
+
+            self.log_message("=" * 50)
+            self.log_message("✓ Download completed successfully!")
+            self.log_message(f"File saved as: {os.path.basename(filename)}")
+            self.log_message("=" * 50)
+
+            # Show success message
+            if notify:
+                message = f"Download completed!\n\nFile: {os.path.basename(filename)}"
+                if job.size_estimate:
+                    message += f"\n{job.size_estimate}"
+                throughput = self.write_scheduler.report()
+                if throughput:
+                    message += "\n\nWrite throughput:\n" + "\n".join(throughput)
+                self.root.after(0, messagebox.showinfo, "Success", message)
+            return True
 
         except yt_dlp.utils.DownloadError as e:
             error_msg = str(e)
             self.log_message(f"✗ Download Error: {error_msg}")
 
             if "ffmpeg" in error_msg.lower() or "ffprobe" in error_msg.lower():
-                self.root.after(
-                    0,
-                    messagebox.showerror,
+                self.show_error(
+                    notify,
                     "FFmpeg Missing",
                     "FFmpeg is required for this operation.\n\n"
                     "Install it using:\n"
@@ -723,18 +2091,16 @@ class YouTubeDownloader:
                     "- Windows: Download from ffmpeg.org"
                 )
             else:
-                self.root.after(
-                    0,
-                    messagebox.showerror,
+                self.show_error(
+                    notify,
                     "Download Error",
                     f"Failed to download video:\n{error_msg}"
                 )
 
         except URLError as e:
             self.log_message(f"✗ Network Error: {e}")
-            self.root.after(
-                0,
-                messagebox.showerror,
+            self.show_error(
+                notify,
                 "Network Error",
                 "Could not connect to the internet.\n"
                 "Please check your connection and try again."
@@ -742,9 +2108,8 @@ class YouTubeDownloader:
 
         except PermissionError as e:
             self.log_message(f"✗ Permission Error: {e}")
-            self.root.after(
-                0,
-                messagebox.showerror,
+            self.show_error(
+                notify,
                 "Permission Error",
                 f"Cannot write to directory:\n{directory}\n\n"
                 "Please choose a different location."
@@ -752,26 +2117,421 @@ class YouTubeDownloader:
 
         except OSError as e:
             self.log_message(f"✗ File System Error: {e}")
-            self.root.after(
-                0,
-                messagebox.showerror,
+            self.show_error(
+                notify,
                 "File System Error",
                 f"Error accessing file system:\n{e}"
             )
 
+        except ClipError as e:
+            self.log_message(f"✗ Invalid Clip: {e}")
+            self.show_error(notify, "Invalid Clip", str(e))
+
         except Exception as e:
             self.log_message(f"✗ Unexpected Error: {e}")
-            self.root.after(
-                0,
-                messagebox.showerror,
+            self.show_error(
+                notify,
                 "Error",
                 f"An unexpected error occurred:\n{e}"
             )
 
+        return False
+
+    def get_breaker(self, host):
+        """Return the circuit breaker for a host, creating it on first use.
+
+        Args:
+            host: Host name; hosts of one domain share a breaker
+
+        Returns:
+            CircuitBreaker: The host's breaker
+        """
+        key = breaker_key(host)
+        with self.breakers_lock:
+            if key not in self.breakers:
+                self.breakers[key] = CircuitBreaker()
+            return self.breakers[key]
+
+    @contextlib.contextmanager
+    def host_slot(self, host):
+        """Hold a slot in a host's circuit breaker for one request step.
+
+        Waits while the breaker is open, then records the step's outcome.
+
+        Args:
+            host: Host the step talks to
+
+        Yields:
+            int: The concurrency the step may use against the host
+        """
+        breaker = self.get_breaker(host)
+        if breaker.state == CircuitBreaker.OPEN:
+            self.set_status(f"⏸ {host} is throttling us; waiting before retrying...")
+        allowed = breaker.acquire()
+        try:
+            yield allowed
+        except Exception as e:
+            breaker.release(False, self.retry_policy.is_retryable(e))
+            raise
+        breaker.release(True)
+
+    def download_with_retry(self, job, ydl_opts, ext):
+        """Run a yt-dlp download, retrying transient failures with backoff.
+
+        Extraction goes through the page host's circuit breaker and the
+        download through the streaming host's. Partial files are kept
+        between attempts so yt-dlp resumes instead of starting over, and an
+        attempt that got further than the last one restarts the attempt
+        count, so long downloads are not cut off by a few blips. Playlist
+        entries already published are recorded in a download archive and
+        skipped by later attempts.
+
+        Args:
+            job: DownloadJob being downloaded
+            ydl_opts: yt-dlp options dict
+            ext: Final file extension including the dot, e.g. ".mp4"
+
+        Returns:
+            tuple: (VideoMeta, downloaded file path)
+
+        Raises:
+            Exception: The last error once it is fatal or attempts run out
+        """
+        ydl_opts = dict(ydl_opts)
+        # Resume from .part files and never silently skip fragments; yt-dlp
+        # retries each request a few times before this loop takes over
+        ydl_opts['continuedl'] = True
+        ydl_opts['retries'] = INNER_RETRIES
+        ydl_opts['fragment_retries'] = INNER_RETRIES
+        ydl_opts['skip_unavailable_fragments'] = False
+        # Published entries leave staging, so without the archive a retried
+        # playlist would download them again
+        ydl_opts['download_archive'] = self.job_archive(job)
+
+        page_host = urlsplit(job.url).hostname
+        attempt = 0
+
+        try:
+            while True:
+                attempt += 1
+                downloaded = job.downloaded_bytes
+
+                try:
+                    with self.host_slot(page_host):
+                        info = self.extract(job, ydl_opts)
+                    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as publisher:
+                        with self.host_slot(stream_host(info) or page_host) as concurrency:
+                            ydl_opts['concurrent_fragment_downloads'] = concurrency
+                            meta, published, fallback = self.run_ydl(
+                                job, ydl_opts, info, ext, publisher
+                            )
+                        # The host slot is free again while copies finish,
+                        # so a slow disk never keeps other jobs off the network
+                    files = [future.result() for future in published]
+                except Exception as e:
+                    if not self.retry_policy.is_retryable(e):
+                        raise
+                    if job.downloaded_bytes > downloaded:
+                        # Resumed further than before: a fresh run of attempts
+                        attempt = 1
+                    if attempt >= self.retry_policy.max_attempts:
+                        raise
+
+                    host = error_host(e, page_host)
+                    delay = self.retry_policy.delay(attempt, e)
+                    self.log_message(
+                        f"↻ Attempt {attempt} failed ({e}); retrying in {delay:.1f}s"
+                    )
+                    status = error_status(e)
+                    reason = f"HTTP {status}" if status else type(error_cause(e)).__name__
+                    self.set_status(
+                        f"↻ {reason} from {host}; retry {attempt + 1} of "
+                        f"{self.retry_policy.max_attempts} in {delay:.0f}s"
+                    )
+                    time.sleep(delay)
+                else:
+                    if attempt > 1:
+                        self.set_status(job.size_estimate or "")
+                    return meta, files[0] if files else fallback
         finally:
-            # Re-enable download button
-            self.is_downloading = False
-            self.root.after(0, self.download_btn.configure, {'state': tk.NORMAL})
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(ydl_opts['download_archive'])
+
+    def job_archive(self, job):
+        """Return the path of the download archive used by a job's attempts.
+
+        Args:
+            job: DownloadJob being downloaded
+
+        Returns:
+            str: Archive path in the root's staging folder
+        """
+        folder = self.write_scheduler.staging_folder(os.path.abspath(job.directory))
+        name = hashlib.md5(job.url.encode('utf-8')).hexdigest()[:12]
+        return os.path.join(folder, f"{name}.archive")
+
+    def extract(self, job, ydl_opts):
+        """Extract a job's info dict and estimate its clip size.
+
+        Args:
+            job: DownloadJob being downloaded
+            ydl_opts: yt-dlp options dict
+
+        Returns:
+            dict: yt-dlp info dict; single videos have their formats selected
+        """
+        # YoutubeDL normalizes some options in place (e.g. outtmpl)
+        with yt_dlp.YoutubeDL(dict(ydl_opts)) as ydl:
+            info = ydl.extract_info(job.url, download=False, process=False)
+            if info.get('_type', 'video') == 'video':
+                # Select formats now for the clip estimate and stream host;
+                # playlist entries are resolved while downloading
+                info = ydl.process_ie_result(info, download=False)
+
+        if job.clip:
+            # Size estimate and progress bar reflect the clip rather than
+            # the full video
+            self.estimate_clip(VideoMeta.from_info(info), job)
+        return info
+
+    def run_ydl(self, job, ydl_opts, info, ext, publisher):
+        """Download an extracted video, playlist or channel.
+
+        Single videos are saved under a path reserved with the output path
+        planner; playlists and channels keep yt-dlp's per-entry template.
+        Everything is downloaded to local staging, and each file is handed
+        to the publisher as soon as yt-dlp has finished it, to be published
+        into the root by the write scheduler while the next entry downloads.
+
+        Args:
+            job: DownloadJob being downloaded
+            ydl_opts: yt-dlp options dict
+            info: Info dict returned by extract()
+            ext: Final file extension including the dot, e.g. ".mp4"
+            publisher: Executor that publishes finished files
+
+        Returns:
+            tuple: (VideoMeta, futures of the published paths, file path to
+            report if nothing was published)
+        """
+        clip = job.clip
+        meta = VideoMeta.from_info(info)
+        home = os.path.abspath(ydl_opts['paths']['home'])
+        published = []
+
+        def publish_file_when_done(path):
+            # yt-dlp calls this with each final file, after post-processing
+            published.append(publisher.submit(self.publish, path, home))
+
+        path = None
+        if info.get('_type', 'video') == 'video':
+            path = self.write_scheduler.staging_path(
+                self.plan_output(home, meta, ext, clip)
+            )
+            outtmpl = self.output_template(path, clip)
+        else:
+            folder = self.write_scheduler.staging_folder(home)
+            outtmpl = os.path.join(folder.replace('%', '%%'), ydl_opts['outtmpl'])
+
+        # The template is absolute, so yt-dlp no longer needs 'paths'
+        ydl_opts = dict(ydl_opts, outtmpl=outtmpl, post_hooks=[publish_file_when_done])
+        del ydl_opts['paths']
+
+        stop_watching = None
+        if path and job.clip_fraction and meta.filesize:
+            stop_watching = self.watch_clip_progress(
+                job, os.path.splitext(path)[0], meta.filesize * job.clip_fraction
+            )
+        try:
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                info = ydl.process_ie_result(info, download=True)
+                fallback = ydl.prepare_filename(info)
+        finally:
+            if stop_watching:
+                stop_watching()
+
+        return VideoMeta.from_info(info), published, fallback
+
+    def watch_clip_progress(self, job, base, total):
+        """Drive a clip's progress from the size of its growing output.
+
+        yt-dlp hands clips to ffmpeg, which never reports 'downloading'
+        progress, only 'finished'. The files starting with the output's
+        base name (including .part and per-chapter files) are polled
+        against the clip's estimated size instead.
+
+        Args:
+            job: DownloadJob being downloaded
+            base: Output path without extension
+            total: Estimated clip size in bytes
+
+        Returns:
+            callable: Stops watching; returns once polling has ended
+        """
+        directory, stem = os.path.split(base)
+        stop = threading.Event()
+
+        def poll():
+            reported = 0.0
+            while not stop.wait(CLIP_PROGRESS_INTERVAL):
+                size = 0
+                try:
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            name = entry.name
+                            if name.startswith(stem) and name[len(stem):][:1] in ('.', ' '):
+                                size += entry.stat().st_size
+                except OSError:
+                    # Files come and go as ffmpeg renames them
+                    continue
+                job.record_bytes(base, size)
+                # The size is an estimate, so never report 100% early
+                percentage = min(size / total * 100, 99.9)
+                if percentage > reported:
+                    reported = percentage
+                    self.report_job_progress(job, percentage)
+
+        thread = threading.Thread(target=poll, daemon=True)
+        thread.start()
+
+        def stop_watching():
+            stop.set()
+            thread.join()
+        return stop_watching
+
+    def publish(self, source, directory):
+        """Move a staged file into an output root under a free name.
+
+        If the name was taken after the directory was indexed (by another
+        program or a file the index never saw), the next free name is
+        reserved and publishing is retried.
+
+        Args:
+            source: Staged file
+            directory: Output root
+
+        Returns:
+            str: Final path of the file
+        """
+        stem, ext = os.path.splitext(os.path.basename(source))
+        target = os.path.join(directory, stem + ext)
+        while True:
+            try:
+                self.write_scheduler.commit(source, target)
+                # Playlist entries and chapter clips were named by yt-dlp,
+                # not the planner; index them so later reservations steer clear
+                self.path_planner.add(target)
+                return target
+            except FileExistsError:
+                self.path_planner.add(target)
+                target = self.path_planner.reserve(directory, stem, ext)
+
+    def plan_output(self, directory, meta, ext, clip=None):
+        """Reserve a unique output path for a video.
+
+        Args:
+            directory: Output root
+            meta: VideoMeta of the video
+            ext: Final file extension including the dot, e.g. ".mp4"
+            clip: Optional ClipRange being downloaded
+
+        Returns:
+            str: The reserved path
+        """
+        stem = sanitize_filename(meta.title)
+        if clip and not clip.chapter:
+            # Keep clips from overwriting full downloads of the same video
+            stem += f" [{clip.start:g}-{clip.end:g}]"
+
+        return self.path_planner.reserve(
+            directory, stem, ext,
+            owner=(meta.video_id or meta.webpage_url, clip)
+        )
+
+    def output_template(self, path, clip=None):
+        """Build the yt-dlp output template for a reserved path.
+
+        Args:
+            path: Reserved output path
+            clip: Optional ClipRange being downloaded
+
+        Returns:
+            str: yt-dlp output template
+        """
+        # Literal '%' in titles would be read as template fields
+        base = os.path.splitext(path)[0].replace('%', '%%')
+        if clip and clip.chapter:
+            # Each matching chapter becomes its own file
+            base += ' [%(section_start)d-%(section_end)d]'
+        return f"{base}.%(ext)s"
+
+    def apply_clip_options(self, ydl_opts, clip):
+        """Configure yt-dlp to fetch only the part of the video in a clip.
+
+        yt-dlp hands clipped downloads to ffmpeg, which seeks within the
+        stream and fetches only the byte ranges/fragments covering the clip.
+        Keyframes are forced at the cuts so the clip starts and ends exactly.
+
+        Args:
+            ydl_opts: yt-dlp options dict to update in place
+            clip: ClipRange to download
+        """
+        if clip.chapter:
+            ranges = yt_dlp.utils.download_range_func([clip.chapter], None)
+            self.log_message(f"Clip: chapters matching '{clip.chapter}'")
+        else:
+            ranges = yt_dlp.utils.download_range_func(None, [(clip.start, clip.end)])
+            self.log_message(f"Clip: {clip.start}s - {clip.end}s")
+
+        ydl_opts['download_ranges'] = ranges
+        ydl_opts['force_keyframes_at_cuts'] = True
+
+    def estimate_clip(self, meta, job):
+        """Work out the clip's share of the video and show its estimated size.
+
+        Args:
+            meta: VideoMeta built after format selection
+            job: DownloadJob with the ClipRange being downloaded
+
+        Raises:
+            ClipError: If the clip covers nothing of the video
+        """
+        clip = job.clip
+        seconds = clip_duration(clip, meta)
+        if seconds is None:
+            # Unknown duration; the bar jumps to 100% when ffmpeg finishes
+            job.clip_fraction = None
+            return
+
+        if not seconds:
+            if clip.chapter:
+                raise ClipError(f"No chapters match '{clip.chapter}'.")
+            raise ClipError(
+                f"Clip start {clip.start:g}s is past the end of the video "
+                f"({meta.duration:g}s)."
+            )
+
+        fraction = min(seconds / meta.duration, 1.0)
+        job.clip_fraction = fraction
+
+        if meta.filesize:
+            job.size_estimate = (
+                f"Estimated clip size: {format_size(meta.filesize * fraction)} "
+                f"of {format_size(meta.filesize)}"
+            )
+            self.log_message(job.size_estimate)
+            self.set_status(job.size_estimate)
+
+    def show_error(self, notify, title, message):
+        """Show an error dialog from a worker thread.
+
+        Args:
+            notify: Only show the dialog when True
+            title: Dialog title
+            message: Dialog message
+        """
+        if notify:
+            self.root.after(0, messagebox.showerror, title, message)
 
 
 def main():